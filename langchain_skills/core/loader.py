@@ -1,23 +1,168 @@
+import functools
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from stat import S_ISDIR
+from types import MappingProxyType
 
 from langchain_skills.core.skill import Skill
 from langchain_skills.core.validator import SkillValidator
 from langchain_skills.exceptions import SkillLoadError, SkillNotFoundError, SkillValidationError
 from langchain_skills.utils.markdown_parser import MarkdownParser
 
+# Upper bound on threads used to load skills concurrently (file reads release the GIL)
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# One process-wide pool for loading skills, shared by concurrent discover_skills
+# calls (e.g. SkillTool scanning several directories) so pools are never nested;
+# threads are only started as work is submitted
+_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="skill-loader")
+
+
+def _scan_skills(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """
+    Recursively yield SKILL.md directory entries below a directory.
+
+    Uses os.scandir so file type checks come from the cached directory
+    entries instead of extra stat() calls. Like Path.rglob, symlinked
+    SKILL.md files are followed, symlinked directories are not descended
+    into, and subdirectories that cannot be read are skipped. Directories
+    are walked with an explicit stack, so deep trees need neither
+    recursion nor chained generators.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Directory entry for each SKILL.md file found
+
+    Raises:
+        PermissionError: If the root directory itself cannot be read
+    """
+    stack: list[str | os.PathLike[str]] = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            it = os.scandir(directory)
+        except PermissionError:
+            if directory is root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                # Cheap name check first so non-matching files never need a type lookup
+                if entry.name == "SKILL.md" and entry.is_file():
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        # Reversed so directories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_skill_cached(skill_md_path: Path, mtime_ns: int, size: int) -> Skill:
+    """
+    Parse and validate a SKILL.md file, memoized by (path, mtime, size).
+
+    Re-creating tools over the same directories reuses already parsed skills
+    as long as the file on disk is unchanged. Failures are not cached.
+
+    Args:
+        skill_md_path: Path to SKILL.md file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key; also sizes the read)
+
+    Returns:
+        Parsed and validated Skill object
+    """
+    try:
+        # Read and parse frontmatter; the body is loaded lazily by Skill.content
+        markdown = MarkdownParser.read(skill_md_path, size)
+        frontmatter, _ = MarkdownParser.parse(markdown, frontmatter_only=True)
+
+        # Validate frontmatter
+        try:
+            SkillValidator.validate_frontmatter(frontmatter)
+        except SkillValidationError as e:
+            # Add file path context to validation errors
+            details = str(e).replace("\n", "\n  - ")
+            raise SkillValidationError(f"Validation failed for {skill_md_path}:\n  - {details}")
+
+        # Intern the name: it is used as the skills map key and looked up per call
+        frontmatter["name"] = sys.intern(frontmatter["name"])
+
+        # Cached skills are shared by every tool, so hand out a read-only view
+        return Skill._from_trusted(skill_md_path, MappingProxyType(frontmatter))
+
+    except (SkillNotFoundError, SkillValidationError, SkillLoadError):
+        raise
+    except Exception as e:
+        raise SkillLoadError(f"Failed to load skill from {skill_md_path}: {e}") from e
+
+
+@functools.lru_cache(maxsize=8)
+def _load_skills_cached(keys: tuple[tuple[str, int, int], ...]) -> tuple[Skill, ...]:
+    """
+    Load every SKILL.md of one directory scan, memoized by its fingerprint.
+
+    The fingerprint is the (path, mtime, size) of each file in scan order,
+    so rediscovering an unchanged directory skips loading entirely. Files are
+    loaded on the shared _EXECUTOR pool. Only a few recent scans are kept;
+    failures are not cached.
+
+    Args:
+        keys: (path, mtime_ns, size) of each SKILL.md found by the scan
+
+    Returns:
+        Loaded Skill objects in scan order
+    """
+    skills = []
+    futures = [
+        _EXECUTOR.submit(_load_skill_cached, Path(path), mtime_ns, size)
+        for path, mtime_ns, size in keys
+    ]
+    for (path, _, _), future in zip(keys, futures):
+        try:
+            skills.append(future.result())
+        except Exception as e:
+            # Fail fast: drop any loads that have not started yet
+            for pending in futures:
+                pending.cancel()
+            raise SkillLoadError(f"Failed to load SKILL.md at {path}: {e}") from e
+
+    return tuple(skills)
+
 
 class SkillLoader:
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop all memoized skills.
+
+        Only needed when a SKILL.md is rewritten in place without changing
+        its size or modification time (e.g. tests writing files within one
+        filesystem timestamp tick).
+        """
+        _load_skills_cached.cache_clear()
+        _load_skill_cached.cache_clear()
+
     @staticmethod
     def load_skill(skill_md_path: Path) -> Skill:
         """
         Load and parse a single SKILL.md file.
 
         Process:
-        1. Read file content (UTF-8)
-        2. Parse with MarkdownParser
+        1. Read file bytes and decode as UTF-8
+        2. Parse frontmatter with MarkdownParser (body is read on first access)
         3. Validate required fields
         4. Return Skill object
 
+        Results are cached per process by (path, mtime, size), so loading an
+        unchanged file again returns the same Skill object.
+
         Args:
             skill_md_path: Path to SKILL.md file
 
@@ -29,39 +174,28 @@ class SkillLoader:
             SkillValidationError: If validation fails
             SkillLoadError: If loading fails for other reasons
         """
-        if not skill_md_path.exists():
-            raise SkillNotFoundError(f"Skill file not found: {skill_md_path}")
-
         try:
-            # Read and parse
-            markdown = skill_md_path.read_text(encoding="utf-8")
-            frontmatter, content = MarkdownParser.parse(markdown)
-
-            # Validate frontmatter
-            try:
-                SkillValidator.validate_frontmatter(frontmatter)
-            except SkillValidationError as e:
-                # Add file path context to validation errors
-                raise SkillValidationError(f"Validation failed for {skill_md_path}:\n  - {e}")
-
-            # Create Skill object
-            return Skill(path=skill_md_path, frontmatter=frontmatter, content=content)
-
-        except (SkillNotFoundError, SkillValidationError, SkillLoadError):
-            raise
-        except Exception as e:
-            raise SkillLoadError(f"Failed to load skill from {skill_md_path}: {e}") from e
+            stat = skill_md_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise SkillNotFoundError(f"Skill file not found: {skill_md_path}") from None
+
+        return _load_skill_cached(skill_md_path, stat.st_mtime_ns, stat.st_size)
 
     @staticmethod
-    def discover_skills(root_directory: Path) -> list[Skill]:
+    def discover_skills(root_directory: str | os.PathLike[str]) -> list[Skill]:
         """
         Recursively find and load all SKILL.md files in a directory.
 
-        Searches recursively for SKILL.md files and attempts to load each one.
-        Stops on first error to fail fast.
+        Searches recursively for SKILL.md files and loads them concurrently
+        in a thread pool. Stops on first error to fail fast. Rediscovering a
+        directory whose SKILL.md files are all unchanged reuses the previous
+        result without loading anything.
+
+        The directory walk works on plain str paths; Path objects are only
+        built for the SKILL.md files that are actually loaded.
 
         Args:
-            root_directory: Root directory to search
+            root_directory: Root directory to search (str or path-like)
 
         Returns:
             List of loaded Skill objects
@@ -71,21 +205,22 @@ class SkillLoader:
             NotADirectoryError: If path is not a directory
             SkillLoadError: If any skill fails to load
         """
-        if not root_directory.exists():
-            raise FileNotFoundError(f"Root directory does not exist: {root_directory}")
+        # One stat answers both "exists" and "is a directory"
+        try:
+            root_stat = os.stat(root_directory)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Root directory does not exist: {root_directory}") from None
 
-        if not root_directory.is_dir():
+        if not S_ISDIR(root_stat.st_mode):
             raise NotADirectoryError(f"Path is not a directory: {root_directory}")
 
-        skills = []
-
-        # Recursively find all SKILL.md files
-        for skill_path in root_directory.rglob("SKILL.md"):
-            if skill_path.is_file():
-                try:
-                    skill = SkillLoader.load_skill(skill_path)
-                    skills.append(skill)
-                except Exception as e:
-                    raise SkillLoadError(f"Failed to load SKILL.md at {skill_path}: {e}") from e
+        # Recursively find all SKILL.md files; each entry caches its own stat()
+        keys = []
+        for entry in _scan_skills(root_directory):
+            # Follows symlinks so a linked SKILL.md is keyed on its target
+            stat = entry.stat()
+            keys.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        if not keys:
+            return []
 
-        return skills
+        return list(_load_skills_cached(tuple(keys)))
@@ -1,53 +1,141 @@
 """Skill data model."""
 
 import html
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from langchain_skills.exceptions import SkillLoadError
+from langchain_skills.utils.markdown_parser import MarkdownParser
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Skill:
     """
     Represents a skill loaded from SKILL.md.
 
     A skill contains metadata (from YAML frontmatter), instructions (markdown content),
     and a reference to its filesystem location.
+
+    When no content is given, the markdown body is read from `path` on first
+    access of `content`, so only invoked skills pay for loading their body.
     """
 
     path: Path
     """Path to the SKILL.md file"""
 
-    frontmatter: dict[str, Any]
-    """Complete YAML frontmatter as dictionary (typically contains 'name' and 'description')"""
+    frontmatter: Mapping[str, Any]
+    """Complete YAML frontmatter (typically contains 'name' and 'description').
+
+    Read-only for skills produced by SkillLoader, which are shared between tools."""
+
+    _content: str | None = field(default=None, init=False, repr=False, compare=False)
+    """Markdown body content, or None until loaded from `path`"""
+
+    _xml: str | None = field(default=None, init=False, repr=False, compare=False)
+    """Cached result of to_xml() (frontmatter is treated as immutable after load)"""
+
+    _name: str | None = field(default=None, init=False, repr=False, compare=False)
+    """frontmatter["name"] captured at construction, or None if missing"""
+
+    _description: str | None = field(default=None, init=False, repr=False, compare=False)
+    """frontmatter["description"] captured at construction, or None if missing"""
+
+    def __init__(
+        self, path: Path, frontmatter: Mapping[str, Any], content: str | None = None
+    ) -> None:
+        # Frozen: fields and caches are set through object.__setattr__
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "frontmatter", frontmatter)
+        object.__setattr__(self, "_content", content)
+        object.__setattr__(self, "_xml", None)
+        object.__setattr__(self, "_name", frontmatter.get("name"))
+        object.__setattr__(self, "_description", frontmatter.get("description"))
+
+    @classmethod
+    def _from_trusted(
+        cls, path: Path, frontmatter: Mapping[str, Any], content: str | None = None
+    ) -> "Skill":
+        """
+        Build a Skill from already validated loader output.
+
+        Skips the regular __init__ call; only used by SkillLoader on hot paths.
+        """
+        skill = cls.__new__(cls)
+        object.__setattr__(skill, "path", path)
+        object.__setattr__(skill, "frontmatter", frontmatter)
+        object.__setattr__(skill, "_content", content)
+        object.__setattr__(skill, "_xml", None)
+        object.__setattr__(skill, "_name", frontmatter["name"])
+        object.__setattr__(skill, "_description", frontmatter["description"])
+        return skill
+
+    def __eq__(self, other: object) -> bool:
+        # Never reads files: bodies are compared only when both are already loaded
+        if other is self:
+            return True
+        if not isinstance(other, Skill):
+            return NotImplemented
+        if self.path != other.path or self.frontmatter != other.frontmatter:
+            return False
+        content, other_content = self._content, other._content
+        return content is None or other_content is None or content == other_content
+
+    def __hash__(self) -> int:
+        # frontmatter is a mapping, so hash on the identifying subset of the compared fields
+        return hash((self.path, self._name))
+
+    @property
+    def content(self) -> str:
+        """
+        Markdown body content (without frontmatter), loaded on first access.
+
+        Raises:
+            SkillLoadError: If the file can no longer be read, or its frontmatter
+                changed on disk since the skill was loaded
+        """
+        content = self._content
+        if content is None:
+            try:
+                frontmatter, content = MarkdownParser.parse(MarkdownParser.read(self.path))
+            except OSError as e:
+                raise SkillLoadError(f"Failed to read skill content from {self.path}: {e}") from e
+            # Never pair a new body with the stale name/description the agent was shown
+            if frontmatter != self.frontmatter:
+                raise SkillLoadError(f"Skill file changed on disk since it was loaded: {self.path}")
+            object.__setattr__(self, "_content", content)
+        return content
 
-    content: str
-    """Markdown body content (without frontmatter)"""
+    @property
+    def is_content_loaded(self) -> bool:
+        """Whether `content` is available without reading the file."""
+        return self._content is not None
 
     @property
     def name(self) -> str:
-        """Get skill name from frontmatter."""
-        return self.frontmatter["name"]
+        """Get skill name from frontmatter (KeyError if missing)."""
+        name = self._name
+        return name if name is not None else self.frontmatter["name"]
 
     @property
     def description(self) -> str:
-        """Get skill description from frontmatter."""
-        return self.frontmatter["description"]
+        """Get skill description from frontmatter (KeyError if missing)."""
+        description = self._description
+        return description if description is not None else self.frontmatter["description"]
 
     @property
     def base_directory(self) -> Path:
         """Get parent directory of SKILL.md (skill's base directory)."""
         return self.path.parent
 
-    def to_xml(self) -> str:
+    @property
+    def xml(self) -> str:
         """
-        Convert frontmatter to XML format for tool description.
+        Frontmatter rendered as XML for the tool description.
 
         Generates XML representation of ALL frontmatter fields,
-        not just name and description.
-
-        Returns:
-            XML string with skill metadata
+        not just name and description. Computed once and cached.
 
         Example:
             ```xml
@@ -57,11 +145,27 @@ class Skill:
             </skill>
             ```
         """
-        # Generate XML for all frontmatter entries with HTML escaping
-        frontmatter_xml = "\n".join(
-            f"  <{key}>{html.escape(str(value))}</{key}>" for key, value in self.frontmatter.items()
-        )
-        return f"<skill>\n{frontmatter_xml}\n</skill>"
+        xml = self._xml
+        if xml is None:
+            # Generate XML for all frontmatter entries with HTML escaping
+            frontmatter_xml = "\n".join(
+                [
+                    f"  <{key}>{html.escape(str(value))}</{key}>"
+                    for key, value in self.frontmatter.items()
+                ]
+            )
+            xml = f"<skill>\n{frontmatter_xml}\n</skill>"
+            object.__setattr__(self, "_xml", xml)
+        return xml
+
+    def to_xml(self) -> str:
+        """
+        Convert frontmatter to XML format for tool description.
+
+        Returns:
+            XML string with skill metadata (same as the `xml` property)
+        """
+        return self.xml
 
     def get_full_content(self) -> str:
         """
@@ -1,17 +1,19 @@
-import re
 from typing import Any
 
 from langchain_skills.exceptions import SkillValidationError
 
+# Allowed skill name bytes; bytes.translate() deletes them, so anything left over is invalid
+_NAME_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789-"
+
 
 class SkillValidator:
     """Validates skill structure and metadata."""
 
-    RESERVED_WORDS = []
+    RESERVED_WORDS: list[str] = []
 
-    # Field constraints from Anthropic docs
-    MAX_NAME_LENGTH = float("inf")
-    MAX_DESCRIPTION_LENGTH = float("inf")
+    # Field constraints from Anthropic docs (None means no limit)
+    MAX_NAME_LENGTH: int | None = None
+    MAX_DESCRIPTION_LENGTH: int | None = None
 
     @staticmethod
     def validate_name(name: str) -> None:
@@ -32,17 +34,22 @@ class SkillValidator:
         if not name or not name.strip():
             raise SkillValidationError("Skill name cannot be empty")
 
-        if len(name) > SkillValidator.MAX_NAME_LENGTH:
+        if (
+            SkillValidator.MAX_NAME_LENGTH is not None
+            and len(name) > SkillValidator.MAX_NAME_LENGTH
+        ):
             raise SkillValidationError(
                 f"Skill name must be {SkillValidator.MAX_NAME_LENGTH} characters or less"
             )
 
-        if not re.match(r"^[a-z0-9-]+$", name):
+        if not name.isascii() or name.encode("ascii").translate(None, _NAME_CHARS):
             raise SkillValidationError(
                 "Skill name must contain only lowercase letters, numbers, and hyphens"
             )
 
-        if any(word in name.lower() for word in SkillValidator.RESERVED_WORDS):
+        if SkillValidator.RESERVED_WORDS and any(
+            word in name.lower() for word in SkillValidator.RESERVED_WORDS
+        ):
             raise SkillValidationError(
                 f"Skill name cannot contain reserved words: {SkillValidator.RESERVED_WORDS}"
             )
@@ -65,7 +72,10 @@ class SkillValidator:
         if not description or not description.strip():
             raise SkillValidationError("Skill description cannot be empty")
 
-        if len(description) > SkillValidator.MAX_DESCRIPTION_LENGTH:
+        if (
+            SkillValidator.MAX_DESCRIPTION_LENGTH is not None
+            and len(description) > SkillValidator.MAX_DESCRIPTION_LENGTH
+        ):
             raise SkillValidationError(
                 f"Skill description must be {SkillValidator.MAX_DESCRIPTION_LENGTH} characters or less"
             )
@@ -83,28 +93,30 @@ class SkillValidator:
         Raises:
             SkillValidationError: If validation fails
         """
-        errors = []
+        errors: list[str] = []
 
-        # Check required fields
-        if "name" not in frontmatter:
+        # Check required fields (a null value counts as missing)
+        name = frontmatter.get("name")
+        if name is None:
             errors.append("Missing required field: name")
-        elif not isinstance(frontmatter["name"], str):
+        elif type(name) is not str:
             errors.append("Field 'name' must be a string")
         else:
             try:
-                SkillValidator.validate_name(str(frontmatter["name"]))
+                SkillValidator.validate_name(name)
             except SkillValidationError as e:
                 errors.append(str(e))
 
-        if "description" not in frontmatter:
+        description = frontmatter.get("description")
+        if description is None:
             errors.append("Missing required field: description")
-        elif not isinstance(frontmatter["description"], str):
+        elif type(description) is not str:
             errors.append("Field 'description' must be a string")
         else:
             try:
-                SkillValidator.validate_description(str(frontmatter["description"]))
+                SkillValidator.validate_description(description)
             except SkillValidationError as e:
                 errors.append(str(e))
 
         if errors:
-            raise SkillValidationError("\\n".join(errors))
+            raise SkillValidationError("\n".join(errors))
@@ -1,14 +1,26 @@
 """LangChain tool for invoking skills."""
 
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from langchain_skills.core.loader import SkillLoader
 from langchain_skills.core.skill import Skill
+from langchain_skills.exceptions import SkillLoadError
+
+# Upper bound on directories scanned concurrently (skills themselves are
+# loaded on the loader's single shared pool)
+_MAX_DIRECTORY_WORKERS = 8
 
 # Default tool description template
 DEFAULT_TOOL_DESCRIPTION_TEMPLATE = """Execute a skill within the main conversation
@@ -34,6 +46,11 @@ Important:
 </available_skills>
 """
 
+# Default template pre-split around its placeholder (with {{ }} escapes resolved)
+_DEFAULT_PREFIX, _DEFAULT_SUFFIX = DEFAULT_TOOL_DESCRIPTION_TEMPLATE.format(
+    skills_xml="{skills_xml}"
+).split("{skills_xml}")
+
 
 class SkillInput(BaseModel):
     """Input schema for Skill tool."""
@@ -115,6 +132,9 @@ class SkillTool(BaseTool):
         ...     directories=".agents/skills",
         ...     description_template="Custom: {skills_xml}"
         ... )
+
+        >>> # Only list the first 20 skills in the description (keeps prompts small)
+        >>> skill_tool = SkillTool(directories=".agents/skills", max_skills_in_description=20)
     """
 
     name: str = "Skill"
@@ -129,6 +149,12 @@ class SkillTool(BaseTool):
         default=None,
         description="Optional custom template for tool description. Use {skills_xml} placeholder.",
     )
+    max_skills_in_description: int | None = Field(
+        default=None,
+        ge=0,
+        description="Optional cap on how many skills are listed in the tool description. "
+        "Skills beyond the cap can still be invoked by name.",
+    )
 
     # Internal state
     skills_map: dict[str, Skill] = Field(default_factory=dict, exclude=True)
@@ -149,30 +175,41 @@ class SkillTool(BaseTool):
         if isinstance(dirs, (str, Path)):
             dirs = [dirs]
 
-        # Load all skills
-        skills: list[Skill] = []
-        for directory in dirs:
-            path = Path(directory)
-            discovered = SkillLoader.discover_skills(path)
-            skills.extend(discovered)
-
-        if not skills:
+        # Discover each directory (str and Path both accepted as-is);
+        # several directories are scanned concurrently
+        if len(dirs) <= 1:
+            discovered = [SkillLoader.discover_skills(directory) for directory in dirs]
+        else:
+            workers = min(_MAX_DIRECTORY_WORKERS, len(dirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                discovered = list(executor.map(SkillLoader.discover_skills, dirs))
+
+        # Build skills map in directory order, failing on the first duplicate name
+        skills_map: dict[str, Skill] = {}
+        for skills in discovered:
+            for skill in skills:
+                existing = skills_map.get(skill.name)
+                if existing is not None:
+                    raise ValueError(
+                        f"Duplicate skill names found: {skill.name} ({existing.path}, {skill.path})"
+                    )
+                skills_map[skill.name] = skill
+
+        if not skills_map:
             raise ValueError(f"No skills found in directories: {dirs}")
 
-        # Build skills map
-        self.skills_map = {skill.name: skill for skill in skills}
-
-        # Check for duplicates
-        if len(self.skills_map) != len(skills):
-            names = [s.name for s in skills]
-            duplicates = set([n for n in names if names.count(n) > 1])
-            raise ValueError(f"Duplicate skill names found: {duplicates}")
+        self.skills_map = skills_map
 
     def _generate_description(self) -> None:
         """Generate tool description from skills."""
-        skills_xml = "\n".join(skill.to_xml() for skill in self.skills_map.values())
-        template = self.description_template or DEFAULT_TOOL_DESCRIPTION_TEMPLATE
-        self.description = template.format(skills_xml=skills_xml)
+        skills: Iterable[Skill] = self.skills_map.values()
+        if self.max_skills_in_description is not None:
+            skills = islice(skills, self.max_skills_in_description)
+        skills_xml = "\n".join([skill.xml for skill in skills])
+        if self.description_template:
+            self.description = self.description_template.format(skills_xml=skills_xml)
+        else:
+            self.description = _DEFAULT_PREFIX + skills_xml + _DEFAULT_SUFFIX
 
     def _run(self, command: str, run_manager: CallbackManagerForToolRun | None = None) -> str:
         """
@@ -185,11 +222,38 @@ class SkillTool(BaseTool):
         Returns:
             Skill content with base directory, or error message
         """
-        skill: Skill = self.skills_map.get(command)
+        skill = self.skills_map.get(command)
 
         if skill is not None:
-            return skill.get_full_content()
-
-        # Skill not found - provide helpful error
-        available_skills = ", ".join(self.skills_map.keys())
+            try:
+                return skill.get_full_content()
+            except SkillLoadError as e:
+                # The body is read on first use; report a vanished or edited file to the agent
+                return f"Failed to load skill: {command}\n{e}"
+
+        # Skill not found - provide helpful error (rare path; reflects the current map)
+        available_skills = ", ".join(self.skills_map)
         return f"Skill not found: {command}\nAvailable skills: {available_skills}"
+
+    async def _arun(
+        self, command: str, run_manager: AsyncCallbackManagerForToolRun | None = None
+    ) -> str:
+        """
+        Execute skill tool asynchronously.
+
+        Only the first invocation of a skill reads its body from disk; that
+        call runs in a worker thread so it does not block the event loop.
+        Skills whose content is already loaded, and unknown names, are
+        answered directly without a thread hop.
+
+        Args:
+            command: Skill name to load
+            run_manager: Async callback manager (optional)
+
+        Returns:
+            Skill content with base directory, or error message
+        """
+        skill = self.skills_map.get(command)
+        if skill is not None and not skill.is_content_loaded:
+            return await asyncio.to_thread(self._run, command)
+        return self._run(command)
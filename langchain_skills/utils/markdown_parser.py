@@ -1,12 +1,140 @@
 """Markdown parser with YAML frontmatter support."""
 
+import os
 import re
+from pathlib import Path
 from typing import Any
 
 import yaml
+from yaml.events import (
+    DocumentEndEvent,
+    DocumentStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
 
 from langchain_skills.exceptions import SkillLoadError
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+_RESOLVER = Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+
+
+def _resolves_to_str(value: str, implicit: tuple[bool, bool] = (True, False)) -> bool:
+    """Return True if YAML would resolve this untagged scalar to a string."""
+    # PyYAML's Resolver.resolve is unannotated in types-PyYAML
+    tag: str = _RESOLVER.resolve(ScalarNode, value, implicit)  # type: ignore[no-untyped-call]
+    return tag == _STR_TAG
+
+
+# One "key: value" frontmatter line with an unindented, identifier-like key
+_FLAT_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):[ ]+(.+)")
+
+# Characters that give a plain scalar special meaning when they start it
+_INDICATOR_CHARS = frozenset("-?:,[]{}#&*!|>%@`")
+
+# Files below this size (known from a prior stat) are read with a single os.read
+_SMALL_FILE_SIZE = 64 * 1024
+
+
+def _parse_flat_lines(yaml_content: str) -> dict[str, str] | None:
+    """
+    Fastest path for frontmatter made only of single-line "key: value" pairs.
+
+    Handles unquoted values and quoted values without escapes, which covers
+    typical SKILL.md files, without involving the YAML parser. Returns None
+    as soon as a line needs real YAML (indentation, comments, block or flow
+    syntax, escapes, non-string scalars) so the caller can fall back.
+    """
+    result: dict[str, str] = {}
+    for line in yaml_content.split("\n"):
+        if not line.strip(" "):
+            continue
+        # Tabs, control characters and Unicode line breaks need the real parser
+        match = _FLAT_LINE_RE.fullmatch(line)
+        if match is None or not line.isprintable():
+            return None
+        key, value = match.group(1), match.group(2).rstrip()
+        if not value:
+            return None
+
+        quote = value[0]
+        if quote == '"' or quote == "'":
+            # Quoted scalars are always strings; only accept ones with nothing to unescape
+            if len(value) < 2 or value[-1] != quote:
+                return None
+            value = value[1:-1]
+            if quote in value or "\\" in value:
+                return None
+        elif (
+            quote in _INDICATOR_CHARS
+            or ": " in value
+            or " #" in value
+            or value.endswith(":")
+            # Plain scalars may resolve to int, bool, null, ...; only keep strings
+            or not _resolves_to_str(value)
+        ):
+            return None
+
+        if not _resolves_to_str(key):
+            return None
+        result[key] = value
+    return result or None
+
+
+def _load_flat_mapping(yaml_content: str) -> dict[str, str] | None:
+    """
+    Fast path for frontmatter that is a flat mapping of string keys to strings.
+
+    Walks the parser events directly instead of building a node graph and
+    running the constructor. Returns None for anything else (nested values,
+    non-string scalars, tags, anchors, empty input) so the caller can fall
+    back to a full yaml.load.
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    events = yaml.parse(yaml_content, Loader=_Loader)
+    if type(next(events)) is not StreamStartEvent:
+        return None
+    if type(next(events)) is not DocumentStartEvent:
+        return None
+    event = next(events)
+    if type(event) is not MappingStartEvent or event.anchor or event.tag:
+        return None
+
+    result: dict[str, str] = {}
+    key: str | None = None
+    for event in events:
+        if type(event) is MappingEndEvent:
+            break
+        if type(event) is not ScalarEvent or event.anchor or event.tag:
+            return None
+        # Plain scalars may resolve to int, bool, null, ...; only keep strings
+        if not _resolves_to_str(event.value, event.implicit):
+            return None
+        if key is None:
+            key = event.value
+        else:
+            result[key] = event.value
+            key = None
+
+    if type(next(events, None)) is not DocumentEndEvent:
+        return None
+    if type(next(events, None)) is not StreamEndEvent:
+        return None
+    return result
+
 
 class MarkdownParser:
     """
@@ -32,12 +160,49 @@ class MarkdownParser:
     """
 
     @staticmethod
-    def parse(markdown_content: str) -> tuple[dict[str, Any], str]:
+    def read(path: Path, size: int | None = None) -> str:
+        """
+        Read a markdown file as UTF-8 text.
+
+        The file is read as bytes and decoded once; newlines are normalized
+        the same way Path.read_text() would. When the caller already knows
+        the file size from a stat and it is small, the bytes are fetched with
+        one os.read call instead of going through a buffered file object.
+
+        Args:
+            path: Path to the markdown file
+            size: File size in bytes from a prior stat, if known
+
+        Returns:
+            Decoded file content
+        """
+        if size is not None and size < _SMALL_FILE_SIZE:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                # One byte extra detects a file that grew since it was stat-ed
+                data = os.read(fd, size + 1)
+                if len(data) > size:
+                    chunks = [data]
+                    while chunk := os.read(fd, _SMALL_FILE_SIZE):
+                        chunks.append(chunk)
+                    data = b"".join(chunks)
+            finally:
+                os.close(fd)
+        else:
+            data = path.read_bytes()
+        markdown = data.decode("utf-8")
+        if "\r" in markdown:
+            markdown = markdown.replace("\r\n", "\n").replace("\r", "\n")
+        return markdown
+
+    @staticmethod
+    def parse(markdown_content: str, frontmatter_only: bool = False) -> tuple[dict[str, Any], str]:
         """
         Parse markdown content and extract YAML frontmatter and body.
 
         Args:
             markdown_content: Raw markdown string with YAML frontmatter
+            frontmatter_only: If True, skip the body and return "" as content
 
         Returns:
             Tuple of (frontmatter dict, content string)
@@ -57,20 +222,45 @@ class MarkdownParser:
         if not markdown_content.startswith("---"):
             raise SkillLoadError("No YAML frontmatter found in SKILL.md")
 
-        # Find the closing delimiter
-        # Pattern: ---\n(yaml content)\n---\n(rest)
-        pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-        match = re.match(pattern, markdown_content, re.DOTALL)
-
-        if not match:
+        # Opening delimiter line: "---" followed only by whitespace
+        first_newline = markdown_content.find("\n")
+        if first_newline == -1 or markdown_content[3:first_newline].strip():
             raise SkillLoadError("No YAML frontmatter found in SKILL.md")
 
-        yaml_content = match.group(1)
-        content = match.group(2).strip()
+        # Closing delimiter: first "\n---" line followed only by whitespace
+        yaml_start = first_newline + 1
+        search_from = yaml_start
+        while True:
+            yaml_end = markdown_content.find("\n---", search_from)
+            if yaml_end == -1:
+                raise SkillLoadError("No YAML frontmatter found in SKILL.md")
+
+            body_start = yaml_end + 4
+            line_end = markdown_content.find("\n", body_start)
+            if line_end == -1:
+                line_end = len(markdown_content)
+            if not markdown_content[body_start:line_end].strip():
+                break
+            search_from = yaml_end + 1
+
+        yaml_content = markdown_content[yaml_start:yaml_end]
+        # Body: nothing to strip when the file ends at (or just after) the delimiter
+        if frontmatter_only or line_end >= len(markdown_content) - 1:
+            content = ""
+        else:
+            content = markdown_content[line_end:].strip()
+
+        # Empty frontmatter needs no YAML parsing
+        if not yaml_content or yaml_content.isspace():
+            return {}, content
 
         # Parse YAML
         try:
-            frontmatter = yaml.safe_load(yaml_content)
+            frontmatter = _parse_flat_lines(yaml_content)
+            if frontmatter is None:
+                frontmatter = _load_flat_mapping(yaml_content)
+            if frontmatter is None:
+                frontmatter = yaml.load(yaml_content, Loader=_Loader)
             if frontmatter is None:
                 frontmatter = {}
         except yaml.YAMLError as e:
@@ -0,0 +1,26 @@
+"""Canonical SKILL.md bodies shared by the test conftests."""
+
+VALID_SKILL_CONTENT = """---
+name: test-skill
+description: A test skill for unit testing
+---
+
+This is the skill content.
+It provides instructions for the agent.
+"""
+
+VALID_SKILL_MINIMAL = """---
+name: minimal
+description: Minimal skill
+---
+"""
+
+SKILL_WITH_EXTRA_FIELDS = """---
+name: extra-fields
+description: Has additional fields
+author: Test Author
+version: 1.0.0
+tags: [test, example]
+---
+Content with extra metadata
+"""
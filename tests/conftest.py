@@ -1,45 +1,51 @@
 """Pytest configuration and shared fixtures."""
 
-import shutil
-import tempfile
-from collections.abc import Generator
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 
+from langchain_skills import SkillTool
+from tests._skill_samples import SKILL_WITH_EXTRA_FIELDS, VALID_SKILL_CONTENT, VALID_SKILL_MINIMAL
+
+# Example skills shipped with the repository
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+@pytest.fixture(scope="session")
+def examples_dir() -> Path:
+    """Get examples directory path."""
+    return EXAMPLES_DIR
+
+
+@pytest.fixture(scope="session")
+def pptx_skill_tool(examples_dir: Path) -> SkillTool:
+    """SkillTool over the example skills, built once per session (tests must not modify it)."""
+    return SkillTool(directories=[examples_dir])
+
 
 @pytest.fixture
-def temp_skill_dir() -> Generator[Path, None, None]:
+def temp_skill_dir(tmp_path: Path) -> Path:
     """Create temporary directory for test skills."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    skills_dir = tmp_path / "skills"
+    skills_dir.mkdir()
+    return skills_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_skill_content() -> str:
     """Return valid SKILL.md content."""
-    return """---
-name: test-skill
-description: A test skill for unit testing
----
-
-This is the skill content.
-It provides instructions for the agent.
-"""
+    return VALID_SKILL_CONTENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_skill_minimal() -> str:
     """Return minimal valid SKILL.md content."""
-    return """---
-name: minimal
-description: Minimal skill
----
-"""
+    return VALID_SKILL_MINIMAL
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_yaml_content() -> str:
     """Return SKILL.md with invalid YAML."""
     return """---
@@ -51,13 +57,13 @@ Content here
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_frontmatter_content() -> str:
     """Return SKILL.md without frontmatter."""
     return """Just some content without any frontmatter."""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def incomplete_frontmatter_content() -> str:
     """Return SKILL.md with only opening delimiter."""
     return """---
@@ -67,7 +73,7 @@ This should fail
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def missing_name_content() -> str:
     """Return SKILL.md missing name field."""
     return """---
@@ -77,7 +83,7 @@ Content here
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def missing_description_content() -> str:
     """Return SKILL.md missing description field."""
     return """---
@@ -87,7 +93,7 @@ Content here
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_name_uppercase() -> str:
     """Return SKILL.md with uppercase name."""
     return """---
@@ -98,7 +104,7 @@ Content
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_name_underscore() -> str:
     """Return SKILL.md with underscore in name."""
     return """---
@@ -109,7 +115,7 @@ Content
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_name_too_long() -> str:
     """Return SKILL.md with name exceeding 64 chars."""
     long_name = "a" * 65
@@ -121,7 +127,7 @@ Content
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_description_too_long() -> str:
     """Return SKILL.md with description exceeding 1024 chars."""
     long_desc = "a" * 1025
@@ -133,21 +139,13 @@ Content
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skill_with_extra_fields() -> str:
     """Return SKILL.md with extra frontmatter fields."""
-    return """---
-name: extra-fields
-description: Has additional fields
-author: Test Author
-version: 1.0.0
-tags: [test, example]
----
-Content with extra metadata
-"""
+    return SKILL_WITH_EXTRA_FIELDS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiline_description() -> str:
     """Return SKILL.md with multiline description."""
     return """---
@@ -164,17 +162,41 @@ Content here
 @pytest.fixture
 def create_skill_file(temp_skill_dir: Path):
     """Factory fixture to create SKILL.md files."""
+    created_dirs: set[Path] = {temp_skill_dir}
 
     def _create_file(content: str, subdir: str = "") -> Path:
         """Create SKILL.md file with given content."""
-        if subdir:
-            skill_dir = temp_skill_dir / subdir
-            skill_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            skill_dir = temp_skill_dir
+        skill_dir = temp_skill_dir / subdir if subdir else temp_skill_dir
+        if skill_dir not in created_dirs:
+            os.makedirs(skill_dir, exist_ok=True)
+            created_dirs.add(skill_dir)
 
         skill_path = skill_dir / "SKILL.md"
-        skill_path.write_text(content)
+        fd = os.open(skill_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
         return skill_path
 
     return _create_file
+
+
+@pytest.fixture
+def create_skill_files(temp_skill_dir: Path):
+    """Factory fixture to create several SKILL.md files at once."""
+
+    def _create_files(skills: Iterable[tuple[str, str]]) -> list[Path]:
+        """Create a SKILL.md for each (content, subdir) pair, making each directory once."""
+        skills = list(skills)
+        for subdir in dict.fromkeys(subdir for _, subdir in skills if subdir):
+            os.makedirs(temp_skill_dir / subdir, exist_ok=True)
+
+        paths = []
+        for content, subdir in skills:
+            skill_path = temp_skill_dir / subdir / "SKILL.md"
+            skill_path.write_text(content)
+            paths.append(skill_path)
+        return paths
+
+    return _create_files
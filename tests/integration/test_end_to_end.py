@@ -6,6 +6,53 @@ import pytest
 
 from langchain_skills import SkillTool
 
+# Checked-in multi-skill fixture tree, resolved once at import
+_FIXTURE_DIR = (Path(__file__).parent.parent / "fixtures" / "multiple_skills").resolve()
+_FIXTURE_EXISTS = _FIXTURE_DIR.exists()
+
+# Skills shared by the read-only tests below
+SHARED_SKILLS = {
+    "only-skill": "---\nname: only-skill\ndescription: Test\n---\nContent",
+    "xml-test": "---\nname: xml-test\ndescription: Test XML with <special> & chars\n---\n",
+    "test": "---\nname: test\ndescription: Test skill\n---\nContent",
+}
+
+
+# (name, description, content) for the multiple-skills workflow
+MULTIPLE_SKILLS = [
+    ("skill-one", "First skill", "Content for skill one"),
+    ("skill-two", "Second skill", "Content for skill two"),
+    ("skill-three", "Third skill", "Content for skill three"),
+]
+
+
+@pytest.fixture(scope="module")
+def multiple_skills_tool(tmp_path_factory: pytest.TempPathFactory) -> SkillTool:
+    """SkillTool over MULTIPLE_SKILLS, built once per module."""
+    skills_dir = tmp_path_factory.mktemp("multiple-skills")
+    for name, desc, content in MULTIPLE_SKILLS:
+        (skills_dir / name).mkdir()
+        (skills_dir / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {desc}\n---\n{content}"
+        )
+    return SkillTool(directories=skills_dir)
+
+
+@pytest.fixture(scope="class")
+def shared_temp_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the shared skills once per test class (tests must not modify them)."""
+    skills_dir = tmp_path_factory.mktemp("shared-skills")
+    for subdir, content in SHARED_SKILLS.items():
+        (skills_dir / subdir).mkdir()
+        (skills_dir / subdir / "SKILL.md").write_text(content)
+    return skills_dir
+
+
+@pytest.fixture(scope="class")
+def shared_skill_tool(shared_temp_skill_dir: Path) -> SkillTool:
+    """SkillTool over the shared skills, built once per test class."""
+    return SkillTool(directories=shared_temp_skill_dir)
+
 
 @pytest.mark.integration
 class TestEndToEnd:
@@ -51,42 +98,34 @@ This skill demonstrates the complete workflow.
         assert "Example Skill" in result
         assert "Do something useful" in result
 
-    def test_complete_workflow_multiple_skills(
-        self, temp_skill_dir: Path, create_skill_file
-    ) -> None:
+    def test_complete_workflow_multiple_skills(self, multiple_skills_tool: SkillTool) -> None:
         """Test workflow with multiple skills."""
-        # Create multiple skills
-        skills = [
-            ("skill-one", "First skill", "Content for skill one"),
-            ("skill-two", "Second skill", "Content for skill two"),
-            ("skill-three", "Third skill", "Content for skill three"),
-        ]
-
-        for name, desc, content in skills:
-            create_skill_file(f"---\nname: {name}\ndescription: {desc}\n---\n{content}", name)
-
-        # Load all skills
-        tool = SkillTool(directories=temp_skill_dir)
-
         # Verify all skills loaded
-        assert len(tool.skills_map) == 3
-        for name, _, _ in skills:
-            assert name in tool.skills_map
-
-        # Test invoking each skill
-        for name, _, content in skills:
-            result = tool._run(name)
-            assert content in result
+        assert len(multiple_skills_tool.skills_map) == 3
+        for name, _, _ in MULTIPLE_SKILLS:
+            assert name in multiple_skills_tool.skills_map
+
+    @pytest.mark.parametrize(
+        "name,content", [(name, content) for name, _, content in MULTIPLE_SKILLS]
+    )
+    def test_complete_workflow_multiple_skills_invoke(
+        self, multiple_skills_tool: SkillTool, name: str, content: str
+    ) -> None:
+        """Test invoking each of multiple skills."""
+        result = multiple_skills_tool._run(name)
+        assert content in result
 
-    def test_workflow_nested_directories(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_workflow_nested_directories(self, temp_skill_dir: Path, create_skill_files) -> None:
         """Test workflow with skills in nested directories."""
         # Create nested structure
-        create_skill_file(
-            "---\nname: top-level\ndescription: Top level\n---\nTop content", "top-level"
-        )
-        create_skill_file(
-            "---\nname: nested\ndescription: Nested skill\n---\nNested content",
-            "level1/level2/nested",
+        create_skill_files(
+            [
+                ("---\nname: top-level\ndescription: Top level\n---\nTop content", "top-level"),
+                (
+                    "---\nname: nested\ndescription: Nested skill\n---\nNested content",
+                    "level1/level2/nested",
+                ),
+            ]
         )
 
         # Discover and load all skills
@@ -104,22 +143,23 @@ This skill demonstrates the complete workflow.
         assert "Top content" in result1
         assert "Nested content" in result2
 
-    def test_workflow_multiple_directories(self, temp_skill_dir: Path) -> None:
+    def test_workflow_multiple_directories(self, temp_skill_dir: Path, create_skill_files) -> None:
         """Test workflow loading from multiple separate directories."""
         # Create two separate skill directories
-        dir1 = temp_skill_dir / "skills_dir1"
-        dir1.mkdir(parents=True)
-        (dir1 / "skill-a" / "SKILL.md").parent.mkdir(parents=True)
-        (dir1 / "skill-a" / "SKILL.md").write_text(
-            "---\nname: skill-a\ndescription: From dir1\n---\nContent A"
+        create_skill_files(
+            [
+                (
+                    "---\nname: skill-a\ndescription: From dir1\n---\nContent A",
+                    "skills_dir1/skill-a",
+                ),
+                (
+                    "---\nname: skill-b\ndescription: From dir2\n---\nContent B",
+                    "skills_dir2/skill-b",
+                ),
+            ]
         )
-
+        dir1 = temp_skill_dir / "skills_dir1"
         dir2 = temp_skill_dir / "skills_dir2"
-        dir2.mkdir(parents=True)
-        (dir2 / "skill-b" / "SKILL.md").parent.mkdir(parents=True)
-        (dir2 / "skill-b" / "SKILL.md").write_text(
-            "---\nname: skill-b\ndescription: From dir2\n---\nContent B"
-        )
 
         # Load from both directories
         tool = SkillTool(directories=[dir1, dir2])
@@ -133,9 +173,8 @@ This skill demonstrates the complete workflow.
         assert "Content A" in tool._run("skill-a")
         assert "Content B" in tool._run("skill-b")
 
-    def test_workflow_custom_template(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_workflow_custom_template(self, shared_temp_skill_dir: Path) -> None:
         """Test workflow with custom description template."""
-        create_skill_file("---\nname: test\ndescription: Test skill\n---\nContent", "test")
 
         custom_template = """My Custom Skill System
 
@@ -145,36 +184,28 @@ Available Skills:
 Use these skills wisely!
 """
 
-        tool = SkillTool(directories=temp_skill_dir, description_template=custom_template)
+        tool = SkillTool(directories=shared_temp_skill_dir, description_template=custom_template)
 
         # Verify custom template used
         assert "My Custom Skill System" in tool.description
         assert "Use these skills wisely!" in tool.description
         assert "<name>test</name>" in tool.description
 
-    def test_workflow_error_handling(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_workflow_error_handling(self, shared_skill_tool: SkillTool) -> None:
         """Test error handling in complete workflow."""
-        create_skill_file("---\nname: only-skill\ndescription: Test\n---\nContent", "only-skill")
-
-        tool = SkillTool(directories=temp_skill_dir)
-
         # Test invalid skill name
-        result = tool._run("nonexistent")
+        result = shared_skill_tool._run("nonexistent")
         assert "Skill not found" in result
         assert "only-skill" in result
 
-    def test_workflow_xml_generation(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_workflow_xml_generation(self, shared_skill_tool: SkillTool) -> None:
         """Test XML generation in workflow."""
-        create_skill_file(
-            "---\nname: xml-test\ndescription: Test XML with <special> & chars\n---\n", "xml-test"
-        )
-
-        tool = SkillTool(directories=temp_skill_dir)
+        description = shared_skill_tool.description
 
         # Verify XML properly escaped
-        assert "<name>xml-test</name>" in tool.description
+        assert "<name>xml-test</name>" in description
         # Special chars should be escaped
-        assert "&lt;special&gt;" in tool.description or "<special>" not in tool.description
+        assert "&lt;special&gt;" in description or "<special>" not in description
 
     def test_workflow_skill_base_directory(self, temp_skill_dir: Path, create_skill_file) -> None:
         """Test that skill execution returns correct base directory."""
@@ -192,12 +223,10 @@ Use these skills wisely!
 
     def test_workflow_with_fixture_skills(self) -> None:
         """Test workflow using real fixture files."""
-        fixture_dir = Path(__file__).parent.parent / "fixtures" / "multiple_skills"
-
-        if not fixture_dir.exists():
+        if not _FIXTURE_EXISTS:
             pytest.skip("Fixture directory not found")
 
-        tool = SkillTool(directories=fixture_dir)
+        tool = SkillTool(directories=_FIXTURE_DIR)
 
         # Verify skills loaded
         assert len(tool.skills_map) > 0
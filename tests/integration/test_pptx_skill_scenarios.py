@@ -8,33 +8,133 @@ These tests validate:
 4. Complete end-to-end workflows
 """
 
+import functools
+import os
 import re
+from collections import Counter
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from langchain_skills.core.loader import SkillLoader
+from langchain_skills.core.skill import Skill
 from langchain_skills.tools import SkillTool
 
+# Command placeholders such as <office_file> or <output_dir>
+_PLACEHOLDER_RE = re.compile(r"<([^>]+)>")
+
+# Body of each ```bash fenced block
+_BASH_BLOCK_RE = re.compile(r"```bash\n(.*?)\n```", re.DOTALL)
+
+# Lines that are python commands, e.g. "python -m markitdown ..." or "python scripts/x.py"
+_PYTHON_COMMAND_RE = re.compile(r"^\s*(python(?: -m | )\S+.*)$", re.MULTILINE)
 
-class TestPPTXSkillBasicFunctionality:
-    """Test basic skill loading and invocation with real PPTX skill."""
+# Code fences and "##"-or-deeper heading markers, matched in a single scan
+_MARKDOWN_MARKER_RE = re.compile(r"```|(#{2,}) ")
+
+# Files the PPTX skill directory must provide, relative to its base directory
+_PPTX_SKILL_FILES = [
+    "scripts/html2pptx.js",
+    "scripts/thumbnail.py",
+    "scripts/inventory.py",
+    "scripts/replace.py",
+    "scripts/rearrange.py",
+    "ooxml/scripts/unpack.py",
+    "ooxml/scripts/pack.py",
+    "ooxml/scripts/validate.py",
+    "html2pptx.md",
+    "ooxml.md",
+]
+
+# Characters html.escape rewrites in skill descriptions
+_XML_SPECIAL_CHARS = frozenset("&<>")
+
+# Example skills tree and the PPTX skill within it, resolved once at import
+_HERE = Path(__file__).resolve().parent
+_REPO_ROOT = _HERE.parent.parent
+_EXAMPLES_DIR = _REPO_ROOT / "examples"
+_PPTX_SKILL_DIR = _EXAMPLES_DIR / "pptx"
+_PPTX_SKILL_PATH = _PPTX_SKILL_DIR / "SKILL.md"
+_PPTX_EXISTS = _PPTX_SKILL_PATH.is_file()
+
+
+@functools.cache
+def _dir_entries(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """Entries of a directory by name, read with a single scandir per session."""
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
+
+
+def _base_dir(result: str) -> Path:
+    """Base directory from the first line of a skill invocation result."""
+    return Path(result.partition("\n")[0].partition(":")[2].strip())
+
+
+# Session-scoped fixtures: tests only read from the tool and its output, so the
+# examples tree is walked and the PPTX skill parsed once per session.
+
+
+@pytest.fixture(scope="session")
+def pptx_skill_dir() -> Path:
+    """Get PPTX skill directory."""
+    return _PPTX_SKILL_DIR
+
+
+@pytest.fixture(scope="session")
+def pptx_skill_path() -> Path:
+    """Get path to the PPTX skill."""
+    return _PPTX_SKILL_PATH
+
+
+@pytest.fixture(scope="session")
+def loaded_pptx_skill(pptx_skill_path: Path) -> Skill:
+    """PPTX skill loaded once for the read-only content checks."""
+    return SkillLoader.load_skill(pptx_skill_path)
+
+
+@pytest.fixture(scope="session")
+def pptx_run_output(pptx_skill_tool: SkillTool) -> str:
+    """Output of invoking the PPTX skill through the tool."""
+    return pptx_skill_tool._run("pptx")
+
+
+@pytest.fixture(scope="session")
+def pptx_run_parsed(pptx_run_output: str) -> SimpleNamespace:
+    """PPTX skill output split into the pieces the tests inspect, computed once."""
+    lines = pptx_run_output.split("\n")
+    return SimpleNamespace(
+        raw=pptx_run_output,
+        lower=pptx_run_output.lower(),
+        lines=lines,
+        base_dir=_base_dir(pptx_run_output),
+        bash_blocks=_BASH_BLOCK_RE.findall(pptx_run_output),
+        python_commands=_PYTHON_COMMAND_RE.findall(pptx_run_output),
+    )
 
-    @pytest.fixture
-    def pptx_skill_path(self) -> Path:
-        """Get path to the PPTX skill."""
-        # Navigate from tests/integration to examples/pptx
-        return Path(__file__).parent.parent.parent / "examples" / "pptx" / "SKILL.md"
 
-    @pytest.fixture
-    def examples_dir(self) -> Path:
-        """Get examples directory path."""
-        return Path(__file__).parent.parent.parent / "examples"
+@pytest.fixture(scope="session")
+def pptx_content_markers(loaded_pptx_skill: Skill) -> Counter[str]:
+    """Occurrences of "```", "## " and "### " in the PPTX skill content, counted in one pass."""
+    counts: Counter[str] = Counter()
+    for match in _MARKDOWN_MARKER_RE.finditer(loaded_pptx_skill.content):
+        hashes = match.group(1)
+        if hashes is None:
+            counts["```"] += 1
+            continue
+        # "### " also contains "## ", matching str.count semantics
+        counts["## "] += 1
+        if len(hashes) >= 3:
+            counts["### "] += 1
+    return counts
+
+
+class TestPPTXSkillBasicFunctionality:
+    """Test basic skill loading and invocation with real PPTX skill."""
 
     def test_pptx_skill_exists(self, pptx_skill_path: Path):
         """Verify PPTX skill file exists."""
-        assert pptx_skill_path.exists(), f"PPTX skill not found at {pptx_skill_path}"
-        assert pptx_skill_path.is_file()
+        assert _PPTX_EXISTS, f"PPTX skill not found at {pptx_skill_path}"
         assert pptx_skill_path.suffix == ".md"
 
     def test_load_pptx_skill(self, pptx_skill_path: Path):
@@ -46,9 +146,9 @@ class TestPPTXSkillBasicFunctionality:
         assert str(skill.base_directory) == str(pptx_skill_path.parent)
         assert len(skill.content) > 1000  # PPTX skill is comprehensive
 
-    def test_pptx_skill_content_structure(self, pptx_skill_path: Path):
+    def test_pptx_skill_content_structure(self, loaded_pptx_skill: Skill):
         """Verify PPTX skill has expected content structure."""
-        skill = SkillLoader.load_skill(pptx_skill_path)
+        skill = loaded_pptx_skill
 
         # Check for key sections
         assert "## Overview" in skill.content
@@ -65,19 +165,18 @@ class TestPPTXSkillBasicFunctionality:
         assert "html2pptx" in skill.content
         assert "scripts/" in skill.content
 
-    def test_create_skill_tool_with_pptx(self, examples_dir: Path):
+    def test_create_skill_tool_with_pptx(self, pptx_skill_tool: SkillTool):
         """Test creating SkillTool with PPTX skill."""
-        tool = SkillTool(directories=[examples_dir])
+        tool = pptx_skill_tool
 
         assert "pptx" in tool.skills_map
         # Tool name is capitalized by default
         assert tool.name.lower() == "skill"
         assert len(tool.skills_map) >= 1
 
-    def test_invoke_pptx_skill(self, examples_dir: Path):
+    def test_invoke_pptx_skill(self, pptx_skill_tool: SkillTool):
         """Test invoking PPTX skill through tool."""
-        tool = SkillTool(directories=[examples_dir])
-        result = tool._run("pptx")
+        result = pptx_skill_tool._run("pptx")
 
         # Verify base directory is included
         assert "Base directory for this skill:" in result
@@ -87,9 +186,9 @@ class TestPPTXSkillBasicFunctionality:
         assert "presentation" in result.lower()
         assert len(result) > 1000
 
-    def test_pptx_skill_xml_generation(self, pptx_skill_path: Path):
+    def test_pptx_skill_xml_generation(self, pptx_skill_tool: SkillTool):
         """Test XML generation for PPTX skill."""
-        skill = SkillLoader.load_skill(pptx_skill_path)
+        skill = pptx_skill_tool.skills_map["pptx"]
         xml = skill.to_xml()
 
         assert xml.startswith("<skill>")
@@ -99,14 +198,13 @@ class TestPPTXSkillBasicFunctionality:
 
         # Verify special characters are escaped
         # If original description has &, <, >, they should be escaped
-        if any(char in skill.description for char in ["&", "<", ">"]):
+        if not _XML_SPECIAL_CHARS.isdisjoint(skill.description):
             assert "&amp;" in xml or "&lt;" in xml or "&gt;" in xml
 
     @pytest.mark.asyncio
-    async def test_async_invoke_pptx_skill(self, examples_dir: Path):
+    async def test_async_invoke_pptx_skill(self, pptx_skill_tool: SkillTool):
         """Test async invocation of PPTX skill."""
-        tool = SkillTool(directories=[examples_dir])
-        result = await tool._arun("pptx")
+        result = await pptx_skill_tool._arun("pptx")
 
         assert "Base directory for this skill:" in result
         assert "presentation" in result.lower()
@@ -115,92 +213,31 @@ class TestPPTXSkillBasicFunctionality:
 class TestFilesystemToolIntegration:
     """Test patterns for filesystem tool integration with PPTX skill."""
 
-    @pytest.fixture
-    def pptx_skill_dir(self) -> Path:
-        """Get PPTX skill directory."""
-        return Path(__file__).parent.parent.parent / "examples" / "pptx"
-
-    @pytest.fixture
-    def skill_tool(self, pptx_skill_dir: Path) -> SkillTool:
-        """Create SkillTool with PPTX skill."""
-        return SkillTool(directories=[pptx_skill_dir])
-
-    def test_extract_base_directory(self, skill_tool: SkillTool):
+    def test_extract_base_directory(self, pptx_run_parsed: SimpleNamespace):
         """Test extracting base directory from skill output."""
-        result = skill_tool._run("pptx")
-
         # Parse base directory
-        lines = result.split("\n")
-        assert len(lines) > 0
-
-        first_line = lines[0]
-        assert "Base directory for this skill:" in first_line
+        assert pptx_run_parsed.raw.startswith("Base directory for this skill:")
 
         # Extract directory path
-        base_dir = first_line.split(":", 1)[1].strip()
-        assert Path(base_dir).exists()
-        assert Path(base_dir).is_dir()
-
-    def test_locate_helper_scripts(self, skill_tool: SkillTool, pptx_skill_dir: Path):
-        """Test locating helper scripts in skill directory."""
-        result = skill_tool._run("pptx")
-        base_dir = result.split("\n")[0].split(":", 1)[1].strip()
-
-        # Check for scripts directory
-        scripts_dir = Path(base_dir) / "scripts"
-        assert scripts_dir.exists(), f"Scripts directory not found at {scripts_dir}"
-
-        # Check for expected scripts
-        expected_scripts = [
-            "html2pptx.js",
-            "thumbnail.py",
-            "inventory.py",
-            "replace.py",
-            "rearrange.py",
-        ]
-
-        for script_name in expected_scripts:
-            script_path = scripts_dir / script_name
-            assert script_path.exists(), f"Expected script not found: {script_name}"
-
-    def test_locate_ooxml_tools(self, skill_tool: SkillTool):
-        """Test locating OOXML tools in skill directory."""
-        result = skill_tool._run("pptx")
-        base_dir = result.split("\n")[0].split(":", 1)[1].strip()
-
-        # Check for ooxml directory
-        ooxml_dir = Path(base_dir) / "ooxml"
-        assert ooxml_dir.exists(), f"OOXML directory not found at {ooxml_dir}"
-
-        # Check for ooxml scripts
-        ooxml_scripts_dir = ooxml_dir / "scripts"
-        assert ooxml_scripts_dir.exists()
-
-        expected_ooxml_scripts = ["unpack.py", "pack.py", "validate.py"]
-        for script_name in expected_ooxml_scripts:
-            script_path = ooxml_scripts_dir / script_name
-            assert script_path.exists(), f"Expected OOXML script not found: {script_name}"
-
-    def test_locate_documentation_files(self, skill_tool: SkillTool):
-        """Test locating documentation files referenced in skill."""
-        result = skill_tool._run("pptx")
-        base_dir = result.split("\n")[0].split(":", 1)[1].strip()
-
-        # Check for referenced markdown files
-        html2pptx_doc = Path(base_dir) / "html2pptx.md"
-        ooxml_doc = Path(base_dir) / "ooxml.md"
-
-        assert html2pptx_doc.exists(), "html2pptx.md not found"
-        assert ooxml_doc.exists(), "ooxml.md not found"
-
-        # Verify they have content
-        assert html2pptx_doc.stat().st_size > 100
-        assert ooxml_doc.stat().st_size > 100
-
-    def test_construct_script_paths(self, skill_tool: SkillTool):
+        base_dir = _base_dir(pptx_run_parsed.raw)
+        assert base_dir.exists()
+        assert base_dir.is_dir()
+
+    @pytest.mark.parametrize("subpath", _PPTX_SKILL_FILES)
+    def test_skill_dir_structure(self, pptx_run_parsed: SimpleNamespace, subpath: str):
+        """Test locating helper scripts, OOXML tools and documentation in skill directory."""
+        path = pptx_run_parsed.base_dir / subpath
+        present = _dir_entries(path.parent)
+        name = path.name
+        assert name in present, f"Expected file not found: {subpath}"
+
+        # Referenced documentation should have content
+        if name.endswith(".md"):
+            assert present[name].stat().st_size > 100
+
+    def test_construct_script_paths(self, pptx_run_parsed: SimpleNamespace):
         """Test constructing full paths to scripts for execution."""
-        result = skill_tool._run("pptx")
-        base_dir = Path(result.split("\n")[0].split(":", 1)[1].strip())
+        base_dir = pptx_run_parsed.base_dir
 
         # Construct paths as an LLM would
         html2pptx_path = base_dir / "scripts" / "html2pptx.js"
@@ -220,52 +257,13 @@ class TestFilesystemToolIntegration:
 class TestBashToolIntegration:
     """Test patterns for bash/terminal tool integration with PPTX skill."""
 
-    @pytest.fixture
-    def skill_tool(self) -> SkillTool:
-        """Create SkillTool with PPTX skill."""
-        examples_dir = Path(__file__).parent.parent.parent / "examples"
-        return SkillTool(directories=[examples_dir])
-
-    def test_extract_bash_commands(self, skill_tool: SkillTool):
+    def test_extract_bash_commands(self, pptx_run_parsed: SimpleNamespace):
         """Test extracting bash commands from skill content."""
-        result = skill_tool._run("pptx")
-
-        # Look for bash code blocks
-        bash_blocks = []
-        lines = result.split("\n")
-        in_bash = False
-        current_block = []
-
-        for line in lines:
-            if "```bash" in line:
-                in_bash = True
-                current_block = []
-            elif "```" in line and in_bash:
-                in_bash = False
-                if current_block:
-                    bash_blocks.append("\n".join(current_block))
-            elif in_bash:
-                current_block.append(line)
-
-        assert len(bash_blocks) > 0, "No bash code blocks found in skill"
-
-    def test_extract_python_commands(self, skill_tool: SkillTool):
+        assert len(pptx_run_parsed.bash_blocks) > 0, "No bash code blocks found in skill"
+
+    def test_extract_python_commands(self, pptx_run_parsed: SimpleNamespace):
         """Test extracting Python command examples from skill."""
-        result = skill_tool._run("pptx")
-
-        # Find python commands
-        python_commands = []
-        for line in result.split("\n"):
-            if "python" in line.lower() and (".py" in line or "-m" in line):
-                # Look for actual command patterns
-                if (
-                    line.strip().startswith("python ")
-                    or "python ooxml/" in line
-                    or "python -m" in line
-                ):
-                    cmd = line.strip()
-                    if cmd and not cmd.startswith("#"):
-                        python_commands.append(cmd)
+        python_commands = pptx_run_parsed.python_commands
 
         assert len(python_commands) > 0, "No Python commands found in skill"
 
@@ -277,10 +275,9 @@ class TestBashToolIntegration:
             or "thumbnail.py" in command_texts
         )
 
-    def test_construct_executable_commands(self, skill_tool: SkillTool):
+    def test_construct_executable_commands(self, pptx_run_parsed: SimpleNamespace):
         """Test constructing executable commands with actual paths."""
-        result = skill_tool._run("pptx")
-        base_dir = result.split("\n")[0].split(":", 1)[1].strip()
+        base_dir = str(pptx_run_parsed.base_dir)
 
         # Construct actual commands
         actual_commands = {
@@ -299,17 +296,15 @@ class TestBashToolIntegration:
             if cmd_name != "markitdown":
                 assert base_dir in cmd
 
-    def test_identify_command_placeholders(self, skill_tool: SkillTool):
+    def test_identify_command_placeholders(self, pptx_run_parsed: SimpleNamespace):
         """Test identifying placeholders in commands that need to be replaced."""
-        result = skill_tool._run("pptx")
-
         # Find commands with placeholders
         placeholders_found = []
-        for line in result.split("\n"):
+        for line in pptx_run_parsed.lines:
             # Look for common placeholder patterns
             if "<" in line and ">" in line and "python" in line:
                 # Extract placeholders
-                matches = re.findall(r"<([^>]+)>", line)
+                matches = _PLACEHOLDER_RE.findall(line)
                 placeholders_found.extend(matches)
 
         # Common placeholders in PPTX skill
@@ -324,15 +319,10 @@ class TestBashToolIntegration:
 class TestCompleteWorkflowScenarios:
     """Test complete end-to-end workflow scenarios."""
 
-    @pytest.fixture
-    def skill_tool(self) -> SkillTool:
-        """Create SkillTool with PPTX skill."""
-        examples_dir = Path(__file__).parent.parent.parent / "examples"
-        return SkillTool(directories=[examples_dir])
-
-    def test_workflow_create_presentation_without_template(self, skill_tool: SkillTool):
+    def test_workflow_create_presentation_without_template(self, pptx_run_parsed: SimpleNamespace):
         """Test workflow for creating presentation without template."""
-        result = skill_tool._run("pptx")
+        result = pptx_run_parsed.raw
+        result_lower = pptx_run_parsed.lower
 
         # Verify workflow section exists
         assert (
@@ -342,38 +332,39 @@ class TestCompleteWorkflowScenarios:
 
         # Verify key steps are mentioned
         assert "html2pptx" in result
-        assert "workflow" in result.lower() or "steps" in result.lower()
+        assert "workflow" in result_lower or "steps" in result_lower
 
         # Verify required files are mentioned
         assert "html2pptx.md" in result
         assert "html2pptx.js" in result
 
-    def test_workflow_edit_existing_presentation(self, skill_tool: SkillTool):
+    def test_workflow_edit_existing_presentation(self, pptx_run_parsed: SimpleNamespace):
         """Test workflow for editing existing presentations."""
-        result = skill_tool._run("pptx")
+        result = pptx_run_parsed.raw
+        result_lower = pptx_run_parsed.lower
 
         # Verify editing workflow exists
-        assert "Editing an existing PowerPoint" in result or "edit" in result.lower()
+        assert "Editing an existing PowerPoint" in result or "edit" in result_lower
 
         # Verify OOXML workflow is mentioned
-        assert "ooxml" in result.lower()
-        assert "unpack" in result.lower()
-        assert "pack" in result.lower() or "repack" in result.lower()
+        assert "ooxml" in result_lower
+        assert "unpack" in result_lower
+        assert "pack" in result_lower or "repack" in result_lower
 
-    def test_workflow_using_template(self, skill_tool: SkillTool):
+    def test_workflow_using_template(self, pptx_run_parsed: SimpleNamespace):
         """Test workflow for creating presentation using template."""
-        result = skill_tool._run("pptx")
+        result_lower = pptx_run_parsed.lower
 
         # Verify template workflow exists
-        assert "template" in result.lower()
+        assert "template" in result_lower
 
         # Verify template-related operations mentioned
-        assert "thumbnail" in result.lower() or "inventory" in result.lower()
+        assert "thumbnail" in result_lower or "inventory" in result_lower
 
-    def test_skill_references_helper_documentation(self, skill_tool: SkillTool):
+    def test_skill_references_helper_documentation(self, pptx_run_parsed: SimpleNamespace):
         """Test that skill properly references helper documentation."""
-        result = skill_tool._run("pptx")
-        base_dir = result.split("\n")[0].split(":", 1)[1].strip()
+        result = pptx_run_parsed.raw
+        base_dir = pptx_run_parsed.base_dir
 
         # Verify references to documentation files
         assert "html2pptx.md" in result
@@ -383,9 +374,10 @@ class TestCompleteWorkflowScenarios:
         assert Path(base_dir, "html2pptx.md").exists()
         assert Path(base_dir, "ooxml.md").exists()
 
-    def test_skill_provides_file_structure_info(self, skill_tool: SkillTool):
+    def test_skill_provides_file_structure_info(self, pptx_run_parsed: SimpleNamespace):
         """Test that skill provides information about file structures."""
-        result = skill_tool._run("pptx")
+        result = pptx_run_parsed.raw
+        result_lower = pptx_run_parsed.lower
 
         # Look for file structure descriptions
         # PPTX files have specific XML structure
@@ -393,11 +385,11 @@ class TestCompleteWorkflowScenarios:
         assert ".xml" in result
 
         # Verify it mentions key PPTX components
-        assert "slide" in result.lower()
+        assert "slide" in result_lower
 
-    def test_llm_can_extract_all_necessary_information(self, skill_tool: SkillTool):
+    def test_llm_can_extract_all_necessary_information(self, pptx_run_output: str):
         """Test that an LLM can extract all necessary information from skill."""
-        result = skill_tool._run("pptx")
+        result = pptx_run_output
 
         # Essential information an LLM needs:
         # 1. Base directory for scripts
@@ -422,11 +414,6 @@ class TestCompleteWorkflowScenarios:
 class TestSkillQualityValidation:
     """Validate the quality and completeness of the PPTX skill."""
 
-    @pytest.fixture
-    def pptx_skill_path(self) -> Path:
-        """Get path to the PPTX skill."""
-        return Path(__file__).parent.parent.parent / "examples" / "pptx" / "SKILL.md"
-
     def test_skill_has_valid_frontmatter(self, pptx_skill_path: Path):
         """Verify skill has valid YAML frontmatter."""
         with open(pptx_skill_path) as f:
@@ -436,9 +423,9 @@ class TestSkillQualityValidation:
         assert "name:" in content[:500]
         assert "description:" in content[:500]
 
-    def test_skill_description_is_informative(self, pptx_skill_path: Path):
+    def test_skill_description_is_informative(self, loaded_pptx_skill: Skill):
         """Verify skill description is clear and informative."""
-        skill = SkillLoader.load_skill(pptx_skill_path)
+        skill = loaded_pptx_skill
 
         # Description should be substantial
         assert len(skill.description) > 50
@@ -448,31 +435,26 @@ class TestSkillQualityValidation:
         desc_lower = skill.description.lower()
         assert "presentation" in desc_lower or "pptx" in desc_lower
 
-    def test_skill_content_has_code_examples(self, pptx_skill_path: Path):
+    def test_skill_content_has_code_examples(self, pptx_content_markers: Counter[str]):
         """Verify skill includes code examples."""
-        skill = SkillLoader.load_skill(pptx_skill_path)
-
         # Should have code blocks
-        assert "```" in skill.content
-        code_block_count = skill.content.count("```")
+        code_block_count = pptx_content_markers["```"]
         assert code_block_count >= 4  # At least 2 code blocks (opening and closing)
 
-    def test_skill_content_organization(self, pptx_skill_path: Path):
+    def test_skill_content_organization(self, pptx_content_markers: Counter[str]):
         """Verify skill content is well organized with sections."""
-        skill = SkillLoader.load_skill(pptx_skill_path)
-
         # Should have multiple sections
-        h2_headers = skill.content.count("## ")
+        h2_headers = pptx_content_markers["## "]
         assert h2_headers >= 3, "Skill should have multiple main sections"
 
         # Should have subsections
-        h3_headers = skill.content.count("### ")
+        h3_headers = pptx_content_markers["### "]
         assert h3_headers >= 2, "Skill should have subsections"
 
-    def test_skill_meets_library_standards(self, pptx_skill_path: Path):
+    def test_skill_meets_library_standards(self, loaded_pptx_skill: Skill):
         """Verify skill meets library quality standards."""
-        # Load successfully (validates YAML and structure)
-        skill = SkillLoader.load_skill(pptx_skill_path)
+        # Loaded by the fixture (validates YAML and structure)
+        skill = loaded_pptx_skill
 
         # Name follows conventions
         assert skill.name.islower()
@@ -0,0 +1,55 @@
+"""Pytest fixtures shared by the unit tests."""
+
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from tests._skill_samples import SKILL_WITH_EXTRA_FIELDS, VALID_SKILL_CONTENT, VALID_SKILL_MINIMAL
+
+# Checked-in multi-skill fixture tree
+MULTIPLE_SKILLS_DIR = Path(__file__).parent.parent / "fixtures" / "multiple_skills"
+
+# Canonical skill layouts: "<layout>/<skill dir>" -> SKILL.md content
+SKILL_TEMPLATES = {
+    "valid/test-skill": VALID_SKILL_CONTENT,
+    "minimal": VALID_SKILL_MINIMAL,
+    "extra-fields": SKILL_WITH_EXTRA_FIELDS,
+    "flat/skill-one": "---\nname: skill-one\ndescription: First skill\n---\nContent 1",
+    "flat/skill-two": "---\nname: skill-two\ndescription: Second skill\n---\nContent 2",
+    "nested/top-level": "---\nname: top-level\ndescription: Top level skill\n---\n",
+    "nested/nested/deep/nested-skill": (
+        "---\nname: nested-skill\ndescription: Nested skill\n---\n"
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def _skill_template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write every canonical skill layout once per session."""
+    template_dir = tmp_path_factory.mktemp("skills-template")
+    for subdir, content in SKILL_TEMPLATES.items():
+        skill_dir = template_dir / subdir
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(content)
+    return template_dir
+
+
+@pytest.fixture
+def skill_template(_skill_template_dir: Path, tmp_path: Path) -> Callable[[str], Path]:
+    """Factory fixture copying one template layout into a fresh per-test directory."""
+
+    def _copy(layout: str) -> Path:
+        """Copy the named layout (e.g. "flat") and return its root."""
+        return Path(shutil.copytree(_skill_template_dir / layout, tmp_path / layout))
+
+    return _copy
+
+
+@pytest.fixture
+def multiple_skills_dir() -> Path:
+    """Checked-in multi-skill fixture tree; skips the test before setup if it is missing."""
+    if not MULTIPLE_SKILLS_DIR.exists():
+        pytest.skip("fixtures not installed")
+    return MULTIPLE_SKILLS_DIR
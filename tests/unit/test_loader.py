@@ -1,13 +1,73 @@
 """Unit tests for SkillLoader."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from langchain_skills.core import loader
 from langchain_skills.core.loader import SkillLoader
 from langchain_skills.core.skill import Skill
 from langchain_skills.exceptions import SkillLoadError, SkillNotFoundError, SkillValidationError
 
+# (content fixture, expected frontmatter or error, expected content or error match)
+LOAD_SKILL_CASES = [
+    pytest.param(
+        "valid_skill_content",
+        {"name": "test-skill", "description": "A test skill for unit testing"},
+        "This is the skill content.\nIt provides instructions for the agent.",
+        id="valid",
+    ),
+    pytest.param(
+        "valid_skill_minimal",
+        {"name": "minimal", "description": "Minimal skill"},
+        "",
+        id="minimal",
+    ),
+    pytest.param(
+        "skill_with_extra_fields",
+        {
+            "name": "extra-fields",
+            "description": "Has additional fields",
+            "author": "Test Author",
+            "version": "1.0.0",
+            "tags": ["test", "example"],
+        },
+        "Content with extra metadata",
+        id="extra_fields",
+    ),
+    pytest.param(
+        "invalid_yaml_content",
+        SkillLoadError,
+        "Failed to parse YAML frontmatter",
+        id="invalid_yaml",
+    ),
+    pytest.param(
+        "no_frontmatter_content",
+        SkillLoadError,
+        "No YAML frontmatter found",
+        id="no_frontmatter",
+    ),
+    pytest.param(
+        "missing_name_content",
+        SkillValidationError,
+        "Missing required field: name",
+        id="missing_name",
+    ),
+    pytest.param(
+        "missing_description_content",
+        SkillValidationError,
+        "Missing required field: description",
+        id="missing_description",
+    ),
+    pytest.param(
+        "invalid_name_uppercase",
+        SkillValidationError,
+        "only lowercase letters",
+        id="invalid_name_format",
+    ),
+]
+
 
 @pytest.mark.unit
 class TestSkillLoader:
@@ -15,137 +75,185 @@ class TestSkillLoader:
 
     # load_skill() Tests
 
-    def test_load_skill_valid(
-        self, temp_skill_dir: Path, create_skill_file, valid_skill_content: str
+    @pytest.mark.parametrize(("content_fixture", "expected", "detail"), LOAD_SKILL_CASES)
+    def test_load_skill_matrix(
+        self,
+        request: pytest.FixtureRequest,
+        create_skill_file,
+        content_fixture: str,
+        expected: dict | type[Exception],
+        detail: str,
     ) -> None:
-        """Test loading a valid skill file."""
-        skill_path = create_skill_file(valid_skill_content, "test-skill")
+        """Test loading each canonical SKILL.md, valid or not."""
+        skill_path = create_skill_file(request.getfixturevalue(content_fixture), "case-skill")
+
+        if not isinstance(expected, dict):
+            with pytest.raises(expected, match=detail):
+                SkillLoader.load_skill(skill_path)
+            return
 
         skill = SkillLoader.load_skill(skill_path)
 
         assert isinstance(skill, Skill)
-        assert skill.name == "test-skill"
-        assert skill.description == "A test skill for unit testing"
-        assert "instructions for the agent" in skill.content
+        assert skill.frontmatter == expected
+        assert skill.content == detail
+        assert skill.path == skill_path
+        assert skill.base_directory == skill_path.parent
 
-    def test_load_skill_minimal(
-        self, temp_skill_dir: Path, create_skill_file, valid_skill_minimal: str
-    ) -> None:
-        """Test loading minimal valid skill."""
-        skill_path = create_skill_file(valid_skill_minimal)
+    def test_load_skill_content_is_lazy(self, skill_template, valid_skill_content: str) -> None:
+        """Test skill body is read from disk on first access of content."""
+        skill_path = skill_template("valid") / "test-skill" / "SKILL.md"
 
         skill = SkillLoader.load_skill(skill_path)
+        skill_path.write_text(valid_skill_content.replace("skill content", "updated content"))
 
-        assert skill.name == "minimal"
-        assert skill.description == "Minimal skill"
+        assert "This is the updated content" in skill.content
 
-    def test_load_skill_with_extra_fields(
-        self, temp_skill_dir: Path, create_skill_file, skill_with_extra_fields: str
+    def test_load_skill_cached_until_file_changes(
+        self, skill_template, valid_skill_content: str
     ) -> None:
-        """Test loading skill with extra frontmatter fields."""
-        skill_path = create_skill_file(skill_with_extra_fields)
+        """Test repeated loads reuse the parsed skill until the file changes."""
+        skill_path = skill_template("valid") / "test-skill" / "SKILL.md"
 
-        skill = SkillLoader.load_skill(skill_path)
+        first = SkillLoader.load_skill(skill_path)
+        assert SkillLoader.load_skill(skill_path) is first
 
-        assert skill.name == "extra-fields"
-        assert skill.frontmatter["author"] == "Test Author"
-        assert skill.frontmatter["version"] == "1.0.0"
+        skill_path.write_text(valid_skill_content.replace("test-skill", "renamed-skill"))
+        second = SkillLoader.load_skill(skill_path)
 
-    def test_load_skill_nonexistent_file(self, temp_skill_dir: Path) -> None:
-        """Test loading non-existent file raises SkillNotFoundError."""
-        nonexistent = temp_skill_dir / "nonexistent" / "SKILL.md"
+        assert second is not first
+        assert second.name == "renamed-skill"
 
-        with pytest.raises(SkillNotFoundError, match="Skill file not found"):
-            SkillLoader.load_skill(nonexistent)
+    def test_cached_skill_frontmatter_is_read_only(self, skill_template) -> None:
+        """Test the shared cached skill cannot be altered through its frontmatter."""
+        skill_path = skill_template("valid") / "test-skill" / "SKILL.md"
 
-    def test_load_skill_invalid_yaml(
-        self, temp_skill_dir: Path, create_skill_file, invalid_yaml_content: str
-    ) -> None:
-        """Test loading skill with invalid YAML raises SkillLoadError."""
-        skill_path = create_skill_file(invalid_yaml_content)
+        skill = SkillLoader.load_skill(skill_path)
+        with pytest.raises(TypeError):
+            skill.frontmatter["description"] = "changed"  # type: ignore[index]
 
-        with pytest.raises(SkillLoadError, match="Failed to parse YAML frontmatter"):
-            SkillLoader.load_skill(skill_path)
+        assert SkillLoader.load_skill(skill_path).description == "A test skill for unit testing"
 
-    def test_load_skill_no_frontmatter(
-        self, temp_skill_dir: Path, create_skill_file, no_frontmatter_content: str
-    ) -> None:
-        """Test loading skill without frontmatter raises SkillLoadError."""
-        skill_path = create_skill_file(no_frontmatter_content)
+    def test_clear_cache_forces_reload(self, skill_template) -> None:
+        """Test clear_cache() drops memoized skills even if the file is unchanged."""
+        skill_path = skill_template("valid") / "test-skill" / "SKILL.md"
+
+        first = SkillLoader.load_skill(skill_path)
+        SkillLoader.clear_cache()
+        second = SkillLoader.load_skill(skill_path)
 
-        with pytest.raises(SkillLoadError, match="No YAML frontmatter found"):
-            SkillLoader.load_skill(skill_path)
+        assert second is not first
+        assert second == first
 
-    def test_load_skill_missing_name(
-        self, temp_skill_dir: Path, create_skill_file, missing_name_content: str
+    def test_discover_skills_reuses_unchanged_directory(
+        self, skill_template, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test loading skill without name raises SkillValidationError."""
-        skill_path = create_skill_file(missing_name_content)
+        """Test rediscovering an unchanged directory skips loading until a file changes."""
+        skills_dir = skill_template("flat")
+        first = SkillLoader.discover_skills(skills_dir)
 
-        with pytest.raises(SkillValidationError, match="Missing required field: name"):
-            SkillLoader.load_skill(skill_path)
+        class NoPool:
+            def submit(self, *args, **kwargs):
+                raise AssertionError("thread pool used for an unchanged directory")
 
-    def test_load_skill_missing_description(
-        self, temp_skill_dir: Path, create_skill_file, missing_description_content: str
-    ) -> None:
-        """Test loading skill without description raises SkillValidationError."""
-        skill_path = create_skill_file(missing_description_content)
+        monkeypatch.setattr(loader, "_EXECUTOR", NoPool())
+        second = SkillLoader.discover_skills(skills_dir)
 
-        with pytest.raises(SkillValidationError, match="Missing required field: description"):
-            SkillLoader.load_skill(skill_path)
+        assert second == first
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second))
 
-    def test_load_skill_invalid_name_format(
-        self, temp_skill_dir: Path, create_skill_file, invalid_name_uppercase: str
-    ) -> None:
-        """Test loading skill with invalid name format raises SkillValidationError."""
-        skill_path = create_skill_file(invalid_name_uppercase)
+        (skills_dir / "skill-one" / "SKILL.md").write_text(
+            "---\nname: skill-one\ndescription: First skill, changed\n---\n"
+        )
+        with pytest.raises(AssertionError, match="thread pool"):
+            SkillLoader.discover_skills(skills_dir)
+
+    def test_load_skill_crlf_line_endings(self, temp_skill_dir: Path) -> None:
+        """Test loading a skill written with Windows line endings."""
+        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path.write_bytes(
+            b"---\r\nname: crlf-skill\r\ndescription: CRLF\r\n---\r\nLine 1\r\nLine 2\r\n"
+        )
+
+        skill = SkillLoader.load_skill(skill_path)
+
+        assert skill.name == "crlf-skill"
+        assert skill.description == "CRLF"
+        assert skill.content == "Line 1\nLine 2"
+
+    def test_load_skill_nonexistent_file(self, temp_skill_dir: Path) -> None:
+        """Test loading non-existent file raises SkillNotFoundError."""
+        nonexistent = temp_skill_dir / "nonexistent" / "SKILL.md"
 
-        with pytest.raises(SkillValidationError, match="only lowercase letters"):
-            SkillLoader.load_skill(skill_path)
+        with pytest.raises(SkillNotFoundError, match="Skill file not found"):
+            SkillLoader.load_skill(nonexistent)
 
     # discover_skills() Tests
 
-    def test_discover_skills_single(
-        self, temp_skill_dir: Path, create_skill_file, valid_skill_content: str
-    ) -> None:
+    def test_discover_skills_single(self, skill_template) -> None:
         """Test discovering single skill in directory."""
-        create_skill_file(valid_skill_content, "skill-one")
-
-        skills = SkillLoader.discover_skills(temp_skill_dir)
+        skills = SkillLoader.discover_skills(skill_template("valid"))
 
         assert len(skills) == 1
         assert skills[0].name == "test-skill"
 
-    def test_discover_skills_multiple_flat(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_discover_skills_multiple_flat(self, skill_template) -> None:
         """Test discovering multiple skills in flat structure."""
-        create_skill_file(
-            "---\nname: skill-one\ndescription: First skill\n---\nContent 1", "skill-one"
-        )
-        create_skill_file(
-            "---\nname: skill-two\ndescription: Second skill\n---\nContent 2", "skill-two"
-        )
-
-        skills = SkillLoader.discover_skills(temp_skill_dir)
+        skills = SkillLoader.discover_skills(skill_template("flat"))
 
         assert len(skills) == 2
         skill_names = {skill.name for skill in skills}
         assert "skill-one" in skill_names
         assert "skill-two" in skill_names
 
-    def test_discover_skills_nested(self, temp_skill_dir: Path, create_skill_file) -> None:
+    def test_discover_skills_nested(self, skill_template) -> None:
         """Test discovering skills in nested directory structure."""
-        create_skill_file("---\nname: top-level\ndescription: Top level skill\n---\n", "top-level")
-        create_skill_file(
-            "---\nname: nested-skill\ndescription: Nested skill\n---\n", "nested/deep/nested-skill"
-        )
-
-        skills = SkillLoader.discover_skills(temp_skill_dir)
+        skills = SkillLoader.discover_skills(skill_template("nested"))
 
         assert len(skills) == 2
         skill_names = {skill.name for skill in skills}
         assert "top-level" in skill_names
         assert "nested-skill" in skill_names
 
+    def test_discover_skills_many(self, temp_skill_dir: Path, create_skill_file) -> None:
+        """Test discovering more skills than a single worker batch."""
+        for i in range(50):
+            create_skill_file(
+                f"---\nname: skill-{i}\ndescription: Skill {i}\n---\nContent {i}", f"skill-{i}"
+            )
+
+        skills = SkillLoader.discover_skills(temp_skill_dir)
+
+        assert len(skills) == 50
+        assert {skill.name for skill in skills} == {f"skill-{i}" for i in range(50)}
+
+    def test_discover_skills_minimizes_stat_calls(
+        self, temp_skill_dir: Path, create_skill_file, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test discovery takes file metadata from scandir entries, not extra stat() calls."""
+        n_files = 10
+        for i in range(n_files):
+            create_skill_file(
+                f"---\nname: skill-{i}\ndescription: Skill {i}\n---\n", f"group-{i % 2}/skill-{i}"
+            )
+
+        calls = 0
+        real_stat = os.stat
+
+        def counting_stat(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return real_stat(*args, **kwargs)
+
+        # Path.stat() delegates to os.stat, so this counts both
+        monkeypatch.setattr(os, "stat", counting_stat)
+
+        skills = SkillLoader.discover_skills(temp_skill_dir)
+
+        assert len(skills) == n_files
+        assert calls <= 2 * n_files
+
     def test_discover_skills_empty_directory(self, temp_skill_dir: Path) -> None:
         """Test discovering skills in empty directory returns empty list."""
         skills = SkillLoader.discover_skills(temp_skill_dir)
@@ -162,6 +270,69 @@ class TestSkillLoader:
 
         assert skills == []
 
+    def test_discover_skills_skips_symlinked_directories(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test symlinked directories are not followed during discovery."""
+        skill_path = create_skill_file(
+            "---\nname: real-skill\ndescription: Real skill\n---\n", "real-skill"
+        )
+        (temp_skill_dir / "linked-skill").symlink_to(skill_path.parent, target_is_directory=True)
+
+        skills = SkillLoader.discover_skills(temp_skill_dir)
+
+        assert len(skills) == 1
+        assert skills[0].path == skill_path
+
+    def test_discover_skills_follows_symlinked_skill_files(
+        self, temp_skill_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test a SKILL.md that is itself a symlink is loaded, as with rglob."""
+        target = tmp_path / "shared.md"
+        target.write_text("---\nname: linked\ndescription: Linked skill\n---\nBody")
+        link = temp_skill_dir / "linked" / "SKILL.md"
+        link.parent.mkdir()
+        link.symlink_to(target)
+
+        skills = SkillLoader.discover_skills(temp_skill_dir)
+
+        assert [skill.name for skill in skills] == ["linked"]
+        assert skills[0].path == link
+
+    @staticmethod
+    def _deny_scandir(monkeypatch: pytest.MonkeyPatch, denied: Path) -> None:
+        """Make os.scandir raise PermissionError for one directory."""
+        real_scandir = os.scandir
+
+        def guarded_scandir(path):
+            if os.fspath(path) == str(denied):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", guarded_scandir)
+
+    def test_discover_skills_skips_unreadable_subdirectories(
+        self, temp_skill_dir: Path, create_skill_file, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test subdirectories that cannot be read are skipped, as with rglob."""
+        create_skill_file("---\nname: readable\ndescription: Readable\n---\n", "readable")
+        create_skill_file("---\nname: locked\ndescription: Locked\n---\n", "locked")
+        self._deny_scandir(monkeypatch, temp_skill_dir / "locked")
+
+        skills = SkillLoader.discover_skills(temp_skill_dir)
+
+        assert [skill.name for skill in skills] == ["readable"]
+
+    def test_discover_skills_unreadable_root_raises(
+        self, temp_skill_dir: Path, create_skill_file, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an unreadable root directory is reported rather than skipped."""
+        create_skill_file("---\nname: readable\ndescription: Readable\n---\n", "readable")
+        self._deny_scandir(monkeypatch, temp_skill_dir)
+
+        with pytest.raises(PermissionError):
+            SkillLoader.discover_skills(temp_skill_dir)
+
     def test_discover_skills_nonexistent_directory(self) -> None:
         """Test discovering skills in non-existent directory raises error."""
         nonexistent = Path("/nonexistent/directory")
@@ -169,18 +340,34 @@ class TestSkillLoader:
         with pytest.raises((FileNotFoundError, SkillNotFoundError)):
             SkillLoader.discover_skills(nonexistent)
 
-    def test_discover_skills_from_fixture_directory(self) -> None:
-        """Test discovering skills from test fixture directory."""
-        fixture_dir = Path(__file__).parent.parent / "fixtures" / "multiple_skills"
+    def test_discover_skills_file_root(self, create_skill_file) -> None:
+        """Test discovering skills from a file path raises NotADirectoryError."""
+        skill_path = create_skill_file("---\nname: file\ndescription: File\n---\n")
+
+        with pytest.raises(NotADirectoryError, match="Path is not a directory"):
+            SkillLoader.discover_skills(skill_path)
+
+        with pytest.raises(FileNotFoundError, match="Root directory does not exist"):
+            SkillLoader.discover_skills(skill_path / "child")
 
-        if fixture_dir.exists():
-            skills = SkillLoader.discover_skills(fixture_dir)
+    def test_discover_skills_string_root(self, skill_template) -> None:
+        """Test a str root is scanned as-is and skills still expose Path objects."""
+        skills = SkillLoader.discover_skills(str(skill_template("valid")))
 
-            assert len(skills) >= 3
-            skill_names = {skill.name for skill in skills}
-            assert "skill-one" in skill_names
-            assert "skill-two" in skill_names
-            assert "skill-three" in skill_names
+        assert len(skills) == 1
+        assert isinstance(skills[0].path, Path)
+        assert skills[0].base_directory.name == "test-skill"
+
+    @pytest.mark.xdist_group("shared_fixtures")
+    def test_discover_skills_from_fixture_directory(self, multiple_skills_dir: Path) -> None:
+        """Test discovering skills from test fixture directory."""
+        skills = SkillLoader.discover_skills(multiple_skills_dir)
+
+        assert len(skills) >= 3
+        skill_names = {skill.name for skill in skills}
+        assert "skill-one" in skill_names
+        assert "skill-two" in skill_names
+        assert "skill-three" in skill_names
 
     def test_discover_skills_mixed_valid_invalid(
         self, temp_skill_dir: Path, create_skill_file
@@ -198,15 +385,3 @@ class TestSkillLoader:
         # Current implementation raises SkillLoadError (wraps SkillValidationError)
         with pytest.raises((SkillValidationError, SkillLoadError)):
             SkillLoader.discover_skills(temp_skill_dir)
-
-    def test_load_skill_path_preserved(
-        self, temp_skill_dir: Path, create_skill_file, valid_skill_content: str
-    ) -> None:
-        """Test that loaded skill preserves original file path."""
-        skill_path = create_skill_file(valid_skill_content, "my-skill")
-
-        skill = SkillLoader.load_skill(skill_path)
-
-        assert skill.path == skill_path
-        assert skill.path.name == "SKILL.md"
-        assert skill.base_directory == skill_path.parent
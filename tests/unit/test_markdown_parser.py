@@ -1,34 +1,136 @@
 """Unit tests for MarkdownParser."""
 
+import textwrap
 from pathlib import Path
 
 import pytest
+import yaml
 
 from langchain_skills.exceptions import SkillLoadError
+from langchain_skills.utils import markdown_parser
 from langchain_skills.utils.markdown_parser import MarkdownParser
 
+# Inline SKILL.md bodies used by single tests below
+_ONLY_DELIMS = "---\n---\n"
+
+_WHITESPACE_CONTENT = textwrap.dedent(
+    """\
+    ---
+    name: whitespace-test
+    description: Test whitespace handling
+    ---
+
+    Content with leading/trailing whitespace.
+
+    """
+)
+
+_COMPLEX_CONTENT = textwrap.dedent(
+    """\
+    ---
+    name: complex
+    description: Complex YAML test
+    nested:
+      field: value
+      list: [1, 2, 3]
+    tags:
+      - test
+      - example
+    ---
+    Content
+    """
+)
+
+_SPECIAL_CONTENT = textwrap.dedent(
+    """\
+    ---
+    name: special-chars
+    description: Test special characters
+    ---
+
+    Content with <xml>, "quotes", and 'apostrophes'.
+    Also & ampersands and #hashtags.
+    """
+)
+
+# (content fixture, expected frontmatter or error, expected content or error match)
+PARSE_CASES = [
+    pytest.param(
+        "valid_skill_content",
+        {"name": "test-skill", "description": "A test skill for unit testing"},
+        "This is the skill content.\nIt provides instructions for the agent.",
+        id="valid",
+    ),
+    pytest.param(
+        "valid_skill_minimal",
+        {"name": "minimal", "description": "Minimal skill"},
+        "",
+        id="minimal",
+    ),
+    pytest.param(
+        "skill_with_extra_fields",
+        {
+            "name": "extra-fields",
+            "description": "Has additional fields",
+            "author": "Test Author",
+            "version": "1.0.0",
+            "tags": ["test", "example"],
+        },
+        "Content with extra metadata",
+        id="extra_fields",
+    ),
+    pytest.param(
+        "no_frontmatter_content",
+        SkillLoadError,
+        "No YAML frontmatter found",
+        id="no_frontmatter",
+    ),
+    pytest.param(
+        "incomplete_frontmatter_content",
+        SkillLoadError,
+        "No YAML frontmatter found",
+        id="incomplete_frontmatter",
+    ),
+    pytest.param(
+        "invalid_yaml_content",
+        SkillLoadError,
+        "Failed to parse YAML frontmatter",
+        id="invalid_yaml",
+    ),
+]
+
 
 @pytest.mark.unit
 class TestMarkdownParser:
     """Test MarkdownParser functionality."""
 
-    def test_parse_valid_skill(self, valid_skill_content: str) -> None:
-        """Test parsing valid SKILL.md content."""
-        frontmatter, content = MarkdownParser.parse(valid_skill_content)
+    @pytest.mark.parametrize(("content_fixture", "expected", "detail"), PARSE_CASES)
+    def test_parse_matrix(
+        self,
+        request: pytest.FixtureRequest,
+        content_fixture: str,
+        expected: dict | type[Exception],
+        detail: str,
+    ) -> None:
+        """Test parsing each canonical SKILL.md, valid or not."""
+        markdown_content = request.getfixturevalue(content_fixture)
 
-        assert isinstance(frontmatter, dict)
-        assert frontmatter["name"] == "test-skill"
-        assert frontmatter["description"] == "A test skill for unit testing"
-        assert "This is the skill content" in content
-        assert "instructions for the agent" in content
+        if not isinstance(expected, dict):
+            with pytest.raises(expected, match=detail):
+                MarkdownParser.parse(markdown_content)
+            return
+
+        frontmatter, content = MarkdownParser.parse(markdown_content)
 
-    def test_parse_minimal_skill(self, valid_skill_minimal: str) -> None:
-        """Test parsing minimal valid SKILL.md."""
-        frontmatter, content = MarkdownParser.parse(valid_skill_minimal)
+        assert frontmatter == expected
+        assert content == detail
 
-        assert frontmatter["name"] == "minimal"
-        assert frontmatter["description"] == "Minimal skill"
-        assert content.strip() == ""
+    def test_parse_frontmatter_only(self, valid_skill_content: str) -> None:
+        """Test frontmatter_only mode skips the body."""
+        frontmatter, content = MarkdownParser.parse(valid_skill_content, frontmatter_only=True)
+
+        assert frontmatter["name"] == "test-skill"
+        assert content == ""
 
     def test_parse_multiline_description(self, multiline_description: str) -> None:
         """Test parsing SKILL.md with multiline description."""
@@ -38,30 +140,6 @@ class TestMarkdownParser:
         assert "multiline description" in frontmatter["description"]
         assert "multiple lines" in frontmatter["description"]
 
-    def test_parse_extra_fields(self, skill_with_extra_fields: str) -> None:
-        """Test parsing SKILL.md with extra frontmatter fields."""
-        frontmatter, content = MarkdownParser.parse(skill_with_extra_fields)
-
-        assert frontmatter["name"] == "extra-fields"
-        assert frontmatter["author"] == "Test Author"
-        assert frontmatter["version"] == "1.0.0"
-        assert "test" in frontmatter["tags"]
-
-    def test_parse_no_frontmatter(self, no_frontmatter_content: str) -> None:
-        """Test parsing content without frontmatter raises error."""
-        with pytest.raises(SkillLoadError, match="No YAML frontmatter found"):
-            MarkdownParser.parse(no_frontmatter_content)
-
-    def test_parse_incomplete_frontmatter(self, incomplete_frontmatter_content: str) -> None:
-        """Test parsing incomplete frontmatter raises error."""
-        with pytest.raises(SkillLoadError, match="No YAML frontmatter found"):
-            MarkdownParser.parse(incomplete_frontmatter_content)
-
-    def test_parse_invalid_yaml(self, invalid_yaml_content: str) -> None:
-        """Test parsing invalid YAML raises error."""
-        with pytest.raises(SkillLoadError, match="Failed to parse YAML frontmatter"):
-            MarkdownParser.parse(invalid_yaml_content)
-
     def test_parse_empty_content(self) -> None:
         """Test parsing empty content raises error."""
         with pytest.raises(SkillLoadError, match="No YAML frontmatter found"):
@@ -69,69 +147,151 @@ class TestMarkdownParser:
 
     def test_parse_only_delimiters(self) -> None:
         """Test parsing only delimiters without content."""
-        content = "---\n---\n"
         with pytest.raises(SkillLoadError):
+            MarkdownParser.parse(_ONLY_DELIMS)
+
+    def test_parse_closing_delimiter_at_end(self) -> None:
+        """Test closing delimiter without a trailing newline."""
+        frontmatter, content = MarkdownParser.parse("---\nname: eof\ndescription: At EOF\n---")
+
+        assert frontmatter["name"] == "eof"
+        assert content == ""
+
+    def test_parse_closing_delimiter_must_end_line(self) -> None:
+        """Test '---' followed by other text is not treated as the closing delimiter."""
+        content = "---\nname: dashes\ndescription: |\n  Text\n---x\n---\nBody\n"
+
+        with pytest.raises(SkillLoadError, match="Failed to parse YAML frontmatter"):
             MarkdownParser.parse(content)
 
-    def test_parse_whitespace_handling(self) -> None:
-        """Test parsing handles extra whitespace correctly."""
-        content = """---
-name: whitespace-test
-description: Test whitespace handling
----
+    def test_parse_empty_frontmatter(self) -> None:
+        """Test empty frontmatter block parses to an empty dict."""
+        frontmatter, content = MarkdownParser.parse("---\n\n---\nBody\n")
 
-Content with leading/trailing whitespace.
+        assert frontmatter == {}
+        assert content == "Body"
 
-"""
-        frontmatter, parsed_content = MarkdownParser.parse(content)
+    def test_parse_whitespace_handling(self) -> None:
+        """Test parsing handles extra whitespace correctly."""
+        frontmatter, parsed_content = MarkdownParser.parse(_WHITESPACE_CONTENT)
 
         assert frontmatter["name"] == "whitespace-test"
         assert "Content with leading/trailing whitespace" in parsed_content
 
     def test_parse_complex_yaml(self) -> None:
         """Test parsing complex YAML structures."""
-        content = """---
-name: complex
-description: Complex YAML test
-nested:
-  field: value
-  list: [1, 2, 3]
-tags:
-  - test
-  - example
----
-Content
-"""
-        frontmatter, parsed_content = MarkdownParser.parse(content)
+        frontmatter, parsed_content = MarkdownParser.parse(_COMPLEX_CONTENT)
 
         assert frontmatter["name"] == "complex"
         assert frontmatter["nested"]["field"] == "value"
         assert frontmatter["nested"]["list"] == [1, 2, 3]
         assert "test" in frontmatter["tags"]
 
-    def test_parse_special_characters_in_content(self) -> None:
-        """Test parsing content with special characters."""
+    def test_parse_typed_scalars(self) -> None:
+        """Test non-string scalar values keep their YAML types."""
         content = """---
-name: special-chars
-description: Test special characters
+name: typed
+description: 'quoted: value'
+version: 1.5
+enabled: true
+empty:
 ---
-
-Content with <xml>, "quotes", and 'apostrophes'.
-Also & ampersands and #hashtags.
+Content
 """
-        frontmatter, parsed_content = MarkdownParser.parse(content)
+        frontmatter, _ = MarkdownParser.parse(content)
+
+        assert frontmatter == {
+            "name": "typed",
+            "description": "quoted: value",
+            "version": 1.5,
+            "enabled": True,
+            "empty": None,
+        }
+
+    def test_parse_flat_fast_path_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test simple key: value frontmatter is parsed without the YAML parser."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parser should not be used")
+
+        monkeypatch.setattr(markdown_parser.yaml, "load", fail)
+        monkeypatch.setattr(markdown_parser.yaml, "parse", fail)
+
+        frontmatter, content = MarkdownParser.parse(
+            "---\nname: flat\ndescription: \"Quoted: value\"\nlicense: 'MIT'\n\n---\nBody\n"
+        )
+
+        assert frontmatter == {"name": "flat", "description": "Quoted: value", "license": "MIT"}
+        assert content == "Body"
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            "name: a\ndescription: b",
+            "name: a\ndescription: 'it''s'",
+            'name: a\ndescription: "tab\\tescape"',
+            "name: a\ndescription: value # comment",
+            "name: a\ndescription: 1.0",
+            "name: a\ndescription: yes",
+            "name: a\ndescription: ~",
+            "name: a\non: b",
+            "name: a\ndescription: >\n  folded",
+            "name: a\ndescription: [x, y]",
+            "name: a\ndescription: -x",
+            "name: a\ndescription: a: b",
+            "name:\tx\ndescription: b",
+            "name: a\ndescription: b\t",
+        ],
+    )
+    def test_parse_flat_fast_path_matches_yaml(self, yaml_content: str) -> None:
+        """Test the fast paths agree with a full load by the parser's own YAML loader."""
+        markdown = f"---\n{yaml_content}\n---\n"
+        try:
+            # Same loader as the fallback (libyaml when available); it differs from
+            # pure-Python PyYAML on e.g. tabs after "key:"
+            expected = yaml.load(yaml_content, Loader=markdown_parser._Loader)
+        except yaml.YAMLError:
+            with pytest.raises(SkillLoadError, match="Failed to parse YAML frontmatter"):
+                MarkdownParser.parse(markdown)
+            return
+
+        frontmatter, _ = MarkdownParser.parse(markdown)
+
+        assert frontmatter == expected
+
+    def test_parse_special_characters_in_content(self) -> None:
+        """Test parsing content with special characters."""
+        frontmatter, parsed_content = MarkdownParser.parse(_SPECIAL_CONTENT)
 
         assert "<xml>" in parsed_content
         assert '"quotes"' in parsed_content
         assert "&" in parsed_content
 
-    def test_parse_from_file(self, temp_skill_dir: Path, valid_skill_content: str) -> None:
-        """Test parsing from actual file."""
-        skill_file = temp_skill_dir / "SKILL.md"
-        skill_file.write_text(valid_skill_content)
+    def test_parse_from_file(self, tmp_path: Path, valid_skill_content: str) -> None:
+        """Test a SKILL.md written to disk round-trips through read() and parse()."""
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(valid_skill_content.replace("\n", "\r\n").encode())
 
-        file_content = skill_file.read_text()
-        frontmatter, content = MarkdownParser.parse(file_content)
+        frontmatter, content = MarkdownParser.parse(MarkdownParser.read(path))
 
+        assert (frontmatter, content) == MarkdownParser.parse(valid_skill_content)
         assert frontmatter["name"] == "test-skill"
-        assert "instructions for the agent" in content
+        assert content == "This is the skill content.\nIt provides instructions for the agent."
+
+    @pytest.mark.parametrize("size_delta", [0, -3], ids=["exact", "grew"])
+    def test_read_with_known_size(self, tmp_path: Path, size_delta: int) -> None:
+        """Test the sized read returns the whole file, even if it grew after the stat."""
+        path = tmp_path / "SKILL.md"
+        path.write_bytes("---\nname: café\n---\r\nBody\r\n".encode())
+
+        markdown = MarkdownParser.read(path, path.stat().st_size + size_delta)
+
+        assert markdown == "---\nname: café\n---\nBody\n"
+        assert markdown == MarkdownParser.read(path)
+
+    def test_read_empty_file_with_known_size(self, tmp_path: Path) -> None:
+        """Test the sized read handles an empty file."""
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(b"")
+
+        assert MarkdownParser.read(path, 0) == ""
@@ -1,19 +1,37 @@
 """Unit tests for Skill dataclass."""
 
+import dataclasses
 from pathlib import Path
 
 import pytest
 
 from langchain_skills.core.skill import Skill
+from langchain_skills.exceptions import SkillLoadError
+
+
+@pytest.fixture(scope="module")
+def sample_skill_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """SKILL.md path for skills built from literal frontmatter (never written)."""
+    return tmp_path_factory.mktemp("sample") / "test-skill" / "SKILL.md"
+
+
+@pytest.fixture(scope="module")
+def sample_skill(sample_skill_path: Path) -> Skill:
+    """Skill shared by the read-only property tests."""
+    return Skill(
+        path=sample_skill_path,
+        frontmatter={"name": "test-skill", "description": "Test description"},
+        content="",
+    )
 
 
 @pytest.mark.unit
 class TestSkill:
     """Test Skill dataclass functionality."""
 
-    def test_create_skill(self, temp_skill_dir: Path) -> None:
+    def test_create_skill(self, sample_skill_path: Path) -> None:
         """Test creating a Skill instance."""
-        skill_path = temp_skill_dir / "test-skill" / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {"name": "test-skill", "description": "Test description"}
         content = "Test content"
 
@@ -23,50 +41,114 @@ class TestSkill:
         assert skill.frontmatter == frontmatter
         assert skill.content == content
 
-    def test_name_property(self, temp_skill_dir: Path) -> None:
-        """Test name property extracts from frontmatter."""
-        skill_path = temp_skill_dir / "SKILL.md"
-        frontmatter = {"name": "my-skill", "description": "Desc"}
+    def test_from_trusted_matches_init(self, sample_skill_path: Path) -> None:
+        """Test _from_trusted() builds the same Skill as the constructor."""
+        skill_path = sample_skill_path
+        frontmatter = {"name": "test-skill", "description": "Test description"}
 
-        skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
+        skill = Skill._from_trusted(skill_path, frontmatter, "Test content")
 
-        assert skill.name == "my-skill"
+        assert skill == Skill(path=skill_path, frontmatter=frontmatter, content="Test content")
+        assert skill.content == "Test content"
+        assert "<name>test-skill</name>" in skill.to_xml()
 
-    def test_description_property(self, temp_skill_dir: Path) -> None:
-        """Test description property extracts from frontmatter."""
-        skill_path = temp_skill_dir / "SKILL.md"
-        frontmatter = {"name": "test", "description": "My description"}
+    def test_skill_has_slots(self, sample_skill: Skill) -> None:
+        """Test Skill is a frozen, slotted dataclass (no per-instance __dict__)."""
+        assert hasattr(Skill, "__slots__")
+        assert not hasattr(sample_skill, "__dict__")
+        assert Skill.__dataclass_params__.frozen is True
 
-        skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_skill.path = sample_skill.path  # type: ignore[misc]
 
-        assert skill.description == "My description"
+    def test_skill_is_hashable(self, sample_skill_path: Path) -> None:
+        """Test equal skills hash alike so they can be deduplicated in sets."""
+        frontmatter = {"name": "test-skill", "description": "Test description"}
+        skill = Skill(path=sample_skill_path, frontmatter=frontmatter, content="Body")
+        same = Skill._from_trusted(sample_skill_path, dict(frontmatter), "Body")
+        other = Skill(
+            path=sample_skill_path.with_name("OTHER.md"), frontmatter=frontmatter, content="Body"
+        )
 
-    def test_base_directory_property(self, temp_skill_dir: Path) -> None:
-        """Test base_directory returns parent directory of SKILL.md."""
-        skill_path = temp_skill_dir / "my-skill" / "SKILL.md"
-        frontmatter = {"name": "test", "description": "Desc"}
+        assert hash(skill) == hash(same)
+        assert {skill, same, other} == {skill, other}
 
-        skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
+    def test_equality_includes_content(self, sample_skill_path: Path) -> None:
+        """Test skills with the same path and frontmatter but different bodies differ."""
+        frontmatter = {"name": "test-skill", "description": "Test description"}
 
-        assert skill.base_directory == skill_path.parent
-        assert skill.base_directory.name == "my-skill"
+        assert Skill(sample_skill_path, frontmatter, "one") != Skill(
+            sample_skill_path, frontmatter, "two"
+        )
+        assert Skill(sample_skill_path, frontmatter, "one") == Skill(
+            sample_skill_path, dict(frontmatter), "one"
+        )
 
-    def test_to_xml_basic(self, temp_skill_dir: Path) -> None:
-        """Test to_xml() generates correct XML."""
-        skill_path = temp_skill_dir / "SKILL.md"
+    def test_equality_does_not_read_files(self, sample_skill_path: Path) -> None:
+        """Test == on skills with unread bodies neither touches disk nor raises."""
+        frontmatter = {"name": "test-skill", "description": "Test description"}
+        lazy = Skill(sample_skill_path, frontmatter)
+        other_lazy = Skill(sample_skill_path, dict(frontmatter))
+
+        assert not sample_skill_path.exists()
+        assert (lazy == other_lazy) is True
+        assert (lazy == Skill(sample_skill_path, frontmatter, "Body")) is True
+        assert lazy in [other_lazy]
+        assert not lazy.is_content_loaded
+
+    def test_content_missing_file_raises_load_error(self, sample_skill: Skill) -> None:
+        """Test a lazy body whose file vanished raises SkillLoadError, not OSError."""
+        skill = Skill(path=sample_skill.path, frontmatter=dict(sample_skill.frontmatter))
+
+        with pytest.raises(SkillLoadError, match="Failed to read skill content"):
+            _ = skill.content
+
+    def test_content_changed_frontmatter_raises_load_error(self, tmp_path: Path) -> None:
+        """Test a lazy body is not paired with frontmatter that changed on disk."""
+        skill_path = tmp_path / "SKILL.md"
+        skill_path.write_text("---\nname: test-skill\ndescription: Renamed\n---\nBody")
+        skill = Skill(skill_path, {"name": "test-skill", "description": "Test description"})
+
+        with pytest.raises(SkillLoadError, match="changed on disk"):
+            _ = skill.content
+
+    def test_is_content_loaded(self, tmp_path: Path) -> None:
+        """Test is_content_loaded flips once a lazy body has been read."""
+        skill_path = tmp_path / "SKILL.md"
         frontmatter = {"name": "test-skill", "description": "Test description"}
+        skill_path.write_text("---\nname: test-skill\ndescription: Test description\n---\nBody")
+        skill = Skill(skill_path, frontmatter)
 
-        skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
-        xml = skill.to_xml()
+        assert not skill.is_content_loaded
+        assert skill.content == "Body"
+        assert skill.is_content_loaded
+        assert Skill(skill_path, frontmatter, "Given").is_content_loaded
+
+    def test_name_property(self, sample_skill: Skill) -> None:
+        """Test name property extracts from frontmatter."""
+        assert sample_skill.name == "test-skill"
+
+    def test_description_property(self, sample_skill: Skill) -> None:
+        """Test description property extracts from frontmatter."""
+        assert sample_skill.description == "Test description"
+
+    def test_base_directory_property(self, sample_skill: Skill) -> None:
+        """Test base_directory returns parent directory of SKILL.md."""
+        assert sample_skill.base_directory == sample_skill.path.parent
+        assert sample_skill.base_directory.name == "test-skill"
+
+    def test_to_xml_basic(self, sample_skill: Skill) -> None:
+        """Test to_xml() generates correct XML."""
+        xml = sample_skill.to_xml()
 
         assert "<skill>" in xml
         assert "</skill>" in xml
         assert "<name>test-skill</name>" in xml
         assert "<description>Test description</description>" in xml
 
-    def test_to_xml_escapes_special_characters(self, temp_skill_dir: Path) -> None:
+    def test_to_xml_escapes_special_characters(self, sample_skill_path: Path) -> None:
         """Test to_xml() escapes special XML characters."""
-        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {
             "name": "test",
             "description": "Description with <tags> & \"quotes\" and 'apostrophes'",
@@ -82,9 +164,9 @@ class TestSkill:
         # html.escape() produces &#x27; for apostrophes
         assert "&#x27;" in xml or "&apos;" in xml
 
-    def test_to_xml_multiline_description(self, temp_skill_dir: Path) -> None:
+    def test_to_xml_multiline_description(self, sample_skill_path: Path) -> None:
         """Test to_xml() handles multiline descriptions."""
-        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {"name": "test", "description": "Line 1\nLine 2\nLine 3"}
 
         skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
@@ -92,6 +174,11 @@ class TestSkill:
 
         assert "<description>Line 1\nLine 2\nLine 3</description>" in xml
 
+    def test_xml_is_cached(self, sample_skill: Skill) -> None:
+        """Test xml property is computed once and matches to_xml()."""
+        assert sample_skill.xml is sample_skill.xml
+        assert sample_skill.to_xml() == sample_skill.xml
+
     def test_get_full_content_basic(self, temp_skill_dir: Path) -> None:
         """Test get_full_content() returns base directory and content."""
         skill_dir = temp_skill_dir / "my-skill"
@@ -137,9 +224,9 @@ class TestSkill:
         # Empty content should still be included
         assert full_content.endswith("\n\n") or full_content.endswith("\n")
 
-    def test_skill_with_extra_frontmatter_fields(self, temp_skill_dir: Path) -> None:
+    def test_skill_with_extra_frontmatter_fields(self, sample_skill_path: Path) -> None:
         """Test Skill allows extra frontmatter fields."""
-        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {
             "name": "test",
             "description": "Desc",
@@ -154,9 +241,9 @@ class TestSkill:
         assert skill.frontmatter["version"] == "1.0.0"
         assert "test" in skill.frontmatter["tags"]
 
-    def test_missing_name_in_frontmatter(self, temp_skill_dir: Path) -> None:
+    def test_missing_name_in_frontmatter(self, sample_skill_path: Path) -> None:
         """Test accessing name when missing from frontmatter."""
-        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {"description": "Desc"}
 
         skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
@@ -165,9 +252,9 @@ class TestSkill:
         with pytest.raises(KeyError):
             _ = skill.name
 
-    def test_missing_description_in_frontmatter(self, temp_skill_dir: Path) -> None:
+    def test_missing_description_in_frontmatter(self, sample_skill_path: Path) -> None:
         """Test accessing description when missing from frontmatter."""
-        skill_path = temp_skill_dir / "SKILL.md"
+        skill_path = sample_skill_path
         frontmatter = {"name": "test"}
 
         skill = Skill(path=skill_path, frontmatter=frontmatter, content="")
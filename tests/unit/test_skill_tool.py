@@ -1,10 +1,15 @@
 """Unit tests for SkillTool."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from langchain_skills.tools.skill_tool import SkillInput, SkillTool
+from langchain_skills.tools.skill_tool import (
+    DEFAULT_TOOL_DESCRIPTION_TEMPLATE,
+    SkillInput,
+    SkillTool,
+)
 
 
 @pytest.mark.unit
@@ -87,6 +92,36 @@ class TestSkillTool:
         with pytest.raises(ValueError, match="Duplicate skill names"):
             SkillTool(directories=temp_skill_dir)
 
+    def test_from_directories_duplicate_reported_in_directory_order(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test concurrently scanned directories report duplicates in configured order."""
+        first = create_skill_file("---\nname: duplicate\ndescription: First\n---\n", "dir1/dup")
+        second = create_skill_file("---\nname: duplicate\ndescription: Second\n---\n", "dir2/dup")
+        create_skill_file("---\nname: other\ndescription: Other\n---\n", "dir3/other")
+
+        with pytest.raises(ValueError, match="Duplicate skill names") as exc_info:
+            SkillTool(
+                directories=[
+                    temp_skill_dir / "dir1",
+                    temp_skill_dir / "dir2",
+                    temp_skill_dir / "dir3",
+                ]
+            )
+
+        assert f"({first}, {second})" in str(exc_info.value)
+
+    def test_from_directories_many_directories_keep_order(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test skills from many directories are listed in configured directory order."""
+        for i in range(12):
+            create_skill_file(f"---\nname: skill-{i}\ndescription: Skill {i}\n---\n", f"d{i}/s")
+
+        tool = SkillTool(directories=[temp_skill_dir / f"d{i}" for i in range(12)])
+
+        assert list(tool.skills_map) == [f"skill-{i}" for i in range(12)]
+
     def test_from_directories_custom_template(
         self, temp_skill_dir: Path, create_skill_file
     ) -> None:
@@ -111,6 +146,32 @@ class TestSkillTool:
         assert "<name>my-skill</name>" in tool.description
         assert "<description>My test skill</description>" in tool.description
 
+    def test_from_directories_default_template(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test default description matches formatting the default template."""
+        create_skill_file("---\nname: my-skill\ndescription: My test skill\n---\n", "my-skill")
+
+        tool = SkillTool(directories=temp_skill_dir)
+
+        skills_xml = tool.skills_map["my-skill"].to_xml()
+        assert tool.description == DEFAULT_TOOL_DESCRIPTION_TEMPLATE.format(skills_xml=skills_xml)
+        assert (
+            '<command-message>The "{name}" skill is loading</command-message>' in tool.description
+        )
+
+    def test_max_skills_in_description(self, temp_skill_dir: Path, create_skill_file) -> None:
+        """Test description lists at most max_skills_in_description skills."""
+        create_skill_file("---\nname: skill-one\ndescription: First\n---\nOne", "skill-one")
+        create_skill_file("---\nname: skill-two\ndescription: Second\n---\nTwo", "skill-two")
+
+        tool = SkillTool(directories=temp_skill_dir, max_skills_in_description=1)
+
+        assert tool.description.count("<skill>") == 1
+        # Skills left out of the description can still be invoked
+        assert "One" in tool._run("skill-one")
+        assert "Two" in tool._run("skill-two")
+
     def test_from_directories_args_schema(self, temp_skill_dir: Path, create_skill_file) -> None:
         """Test tool has correct args_schema."""
         create_skill_file("---\nname: test\ndescription: Test\n---\n", "test")
@@ -148,6 +209,31 @@ class TestSkillTool:
         assert "Available skills:" in result
         assert "valid-skill" in result
 
+    def test_run_skill_file_removed_after_load(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test a SKILL.md deleted after discovery yields an error message, not an exception."""
+        skill_path = create_skill_file("---\nname: gone\ndescription: Test\n---\nBody", "gone")
+        tool = SkillTool(directories=temp_skill_dir)
+
+        skill_path.unlink()
+        result = tool._run("gone")
+
+        assert result.startswith("Failed to load skill: gone")
+
+    def test_run_skill_frontmatter_changed_after_load(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test an edited SKILL.md is not served under the frontmatter shown to the agent."""
+        skill_path = create_skill_file("---\nname: edit\ndescription: Old\n---\nOld", "edit")
+        tool = SkillTool(directories=temp_skill_dir)
+
+        skill_path.write_text("---\nname: edit\ndescription: New\n---\nNew")
+        result = tool._run("edit")
+
+        assert result.startswith("Failed to load skill: edit")
+        assert "changed on disk" in result
+
     def test_run_lists_available_skills(self, temp_skill_dir: Path, create_skill_file) -> None:
         """Test error message lists all available skills."""
         create_skill_file("---\nname: skill-one\ndescription: First\n---\n", "skill-one")
@@ -159,6 +245,18 @@ class TestSkillTool:
         assert "skill-one" in result
         assert "skill-two" in result
 
+    def test_run_lists_skills_added_after_init(
+        self, temp_skill_dir: Path, create_skill_file
+    ) -> None:
+        """Test the not-found message reflects later changes to skills_map."""
+        create_skill_file("---\nname: skill-one\ndescription: First\n---\n", "skill-one")
+        tool = SkillTool(directories=temp_skill_dir)
+
+        tool.skills_map["skill-two"] = tool.skills_map.pop("skill-one")
+        result = tool._run("invalid")
+
+        assert result.endswith("Available skills: skill-two")
+
     def test_run_returns_full_content(self, temp_skill_dir: Path, create_skill_file) -> None:
         """Test _run() returns same as Skill.get_full_content()."""
         create_skill_file("---\nname: test\ndescription: Test\n---\nContent", "test")
@@ -184,6 +282,32 @@ class TestSkillTool:
 
         assert sync_result == async_result
 
+    @pytest.mark.asyncio
+    async def test_arun_offloads_only_first_read(
+        self, temp_skill_dir: Path, create_skill_file, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test _arun() uses a worker thread only while the skill body is unread."""
+        create_skill_file("---\nname: test\ndescription: Test\n---\nContent", "test")
+        tool = SkillTool(directories=temp_skill_dir)
+
+        offloaded = []
+        to_thread = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args):
+            offloaded.append(args)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", tracking_to_thread)
+
+        first = await tool._arun("test")
+        second = await tool._arun("test")
+        missing = await tool._arun("missing")
+
+        assert first == second
+        assert "Content" in first
+        assert "Skill not found: missing" in missing
+        assert offloaded == [("test",)]
+
     # Integration with Real Fixtures
 
     def test_from_fixture_directory(self) -> None:
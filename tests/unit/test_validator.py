@@ -75,6 +75,20 @@ class TestSkillValidator:
             with pytest.raises(SkillValidationError):
                 SkillValidator.validate_name(name)
 
+    def test_validate_name_trailing_newline(self) -> None:
+        """Test a trailing newline fails validation."""
+        with pytest.raises(
+            SkillValidationError, match="only lowercase letters, numbers, and hyphens"
+        ):
+            SkillValidator.validate_name("code-reviewer\n")
+
+    def test_validate_name_non_ascii(self) -> None:
+        """Test non-ASCII letters fail validation."""
+        with pytest.raises(
+            SkillValidationError, match="only lowercase letters, numbers, and hyphens"
+        ):
+            SkillValidator.validate_name("café")
+
     def test_validate_name_leading_hyphen(self) -> None:
         """Test leading hyphen is valid (allowed by regex)."""
         # If you want to disallow this, update the validator
@@ -142,6 +156,13 @@ class TestSkillValidator:
         with pytest.raises(SkillValidationError, match="Missing required field: description"):
             SkillValidator.validate_frontmatter(frontmatter)
 
+    def test_validate_frontmatter_null_name(self) -> None:
+        """Test frontmatter with an empty (null) name is treated as missing."""
+        frontmatter = {"name": None, "description": "A test skill"}
+
+        with pytest.raises(SkillValidationError, match="Missing required field: name"):
+            SkillValidator.validate_frontmatter(frontmatter)
+
     def test_validate_frontmatter_missing_both(self) -> None:
         """Test frontmatter missing both fields fails."""
         frontmatter: dict = {}
@@ -149,6 +170,24 @@ class TestSkillValidator:
         with pytest.raises(SkillValidationError, match="Missing required field"):
             SkillValidator.validate_frontmatter(frontmatter)
 
+    def test_validate_frontmatter_errors_on_separate_lines(self) -> None:
+        """Test multiple errors are reported one per line."""
+        with pytest.raises(SkillValidationError) as exc_info:
+            SkillValidator.validate_frontmatter({})
+
+        assert str(exc_info.value).splitlines() == [
+            "Missing required field: name",
+            "Missing required field: description",
+        ]
+
+    def test_validate_name_max_length(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test MAX_NAME_LENGTH is enforced when set."""
+        monkeypatch.setattr(SkillValidator, "MAX_NAME_LENGTH", 4)
+
+        SkillValidator.validate_name("abcd")
+        with pytest.raises(SkillValidationError, match="4 characters or less"):
+            SkillValidator.validate_name("abcde")
+
     def test_validate_frontmatter_invalid_name(self) -> None:
         """Test frontmatter with invalid name format fails."""
         frontmatter = {"name": "Invalid_Name", "description": "A test skill"}